@@ -12,31 +12,86 @@ Each router acts as a gateway to a specific stage of the PolicyExplainer pipelin
 Design notes:
 - These handlers are intentionally thin: they validate inputs, delegate to backend modules,
   and translate errors into HTTP status codes appropriate for the frontend.
-- Successful responses are returned as plain JSON-serializable dicts. When backend modules
-  return Pydantic models, we convert them via `.model_dump()`.
+- Long-running synchronous pipelines (ingestion, full summary, evaluation) run in a worker thread via
+  `asyncio.to_thread`, so the event loop keeps serving other requests while they execute.
+- Successful responses are returned as JSON. When backend modules return Pydantic models,
+  we serialize them via `.model_dump_json()` (pydantic-core emits JSON bytes directly) and
+  wrap the result in a plain `Response`, skipping the intermediate dict and FastAPI's
+  re-encoding pass.
 
 Key inputs/outputs:
 - Ingestion expects an uploaded PDF (UploadFile) and returns a document identifier `doc_id`.
 - Summary and Q&A endpoints accept a `doc_id` path parameter (string) referencing stored/indexed content.
-- Summary endpoints return structured Pydantic outputs serialized to dict.
+- Summary endpoints return structured Pydantic outputs serialized straight to JSON.
 - Evaluation returns computed metrics (implementation-defined by `run_all_evaluations`).
 
 Error handling conventions:
 - Validation / user input issues: HTTP 400 (e.g., non-PDF upload, invalid section id, empty question).
+- Oversized uploads: HTTP 413, decided by `limit_upload_size` middleware from the Content-Length
+  header before the body is read (limit: `Settings.max_upload_bytes`).
 - Known ingestion validation failures: HTTP 400 (propagated from `ValueError` with a safe message).
 - Unexpected server errors: HTTP 500 with a descriptive message.
 """
 
-from fastapi import APIRouter, HTTPException, UploadFile
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Request, Response, UploadFile
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from backend import storage
+from backend.config import get_settings
 from backend.evaluation import run_all_evaluations
-from backend.ingestion import run_ingest
+from backend.ingestion import run_ingest_stream
 from backend.qa import route_question  # We only need the unified router now!
-from backend.retrieval import CORE_SECTIONS, retrieve_for_section
+from backend.qa_cache import qa_cache, qa_semantic_cache, scenario_cache
+from backend.retrieval import CORE_SECTIONS_SET, retrieve_for_section
 from backend.summarization import run_full_summary_pipeline, summarize_section
 
+
+def _model_response(model: BaseModel) -> Response:
+    """
+    Serialize a Pydantic model directly into a JSON HTTP response.
+
+    `model_dump_json()` runs in pydantic-core, so this avoids building an intermediate
+    Python dict (`model_dump()`) that FastAPI would then walk and encode a second time.
+
+    Args:
+        model: Any Pydantic model returned by a backend module.
+
+    Returns:
+        Response: An `application/json` response containing the serialized model.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+# Paths whose request bodies are subject to the upload size limit.
+UPLOAD_PATHS = frozenset({"/ingest"})
+
+
+async def limit_upload_size(request: Request, call_next) -> Response:
+    """
+    HTTP middleware that rejects oversized uploads before their body is read.
+
+    FastAPI parses (and spools) a multipart body before the route handler runs, so a
+    size check inside `ingest` would only fire after the whole upload was received.
+    Checking the declared Content-Length here turns that into an O(1) rejection.
+    Requests without a (valid) Content-Length header are passed through unchanged.
+
+    Registered on the app in `backend.main`.
+
+    Returns:
+        Response: 413 JSON error for oversized uploads, otherwise the downstream response.
+    """
+    if request.method == "POST" and request.url.path in UPLOAD_PATHS:
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            if int(content_length) > get_settings().max_upload_bytes:
+                return JSONResponse(status_code=413, content={"detail": "File too large"})
+
+    return await call_next(request)
+
+
 # --- Ingest: PDF Upload & Processing ---
 # This router groups endpoints related to accepting documents and initiating ingestion.
 router_ingest = APIRouter()
@@ -49,9 +104,9 @@ async def ingest(file: UploadFile) -> dict:
 
     Validation performed here is intentionally lightweight and fast:
     - Check filename extension indicates PDF.
-    - Check file content begins with the PDF magic header (%PDF).
+    - Check file content begins with the PDF magic header (%PDF), reading only 4 bytes.
 
-    On success, delegates to `run_ingest(content)` which is responsible for:
+    On success, delegates to `run_ingest_stream(file.file)` which is responsible for:
     parsing, cleaning, chunking, embedding/indexing, and persisting any artifacts,
     then returns a unique document identifier (`doc_id`) used across the API.
 
@@ -64,22 +119,35 @@ async def ingest(file: UploadFile) -> dict:
         raise HTTPException(status_code=400, detail="File must be a PDF")
 
     try:
-        # UploadFile.read() is async; we read the full content into memory here.
-        # (In the future, streaming could be used if extremely large files are expected.)
-        content = await file.read()
-
         # Minimal header validation: a real PDF begins with the bytes "%PDF".
-        # This avoids wasting time on obviously wrong uploads with a .pdf extension.
-        if len(content) < 4 or content[:4] != b"%PDF":
+        # Only the first 4 bytes are read, so obviously wrong uploads are rejected
+        # without ever buffering the full body in memory.
+        head = await file.read(4)
+        if head != b"%PDF":
             raise HTTPException(status_code=400, detail="Invalid PDF format")
 
-        # Delegate core ingestion work to the ingestion module.
-        # `run_ingest` should raise ValueError for "expected" validation failures.
-        doc_id = run_ingest(content)
+        # Rewind and hand the underlying spooled file to the ingestion module, which
+        # streams it to disk in fixed-size blocks instead of loading it into RAM.
+        # `run_ingest_stream` should raise ValueError for "expected" validation failures.
+        # Parsing, chunking and embedding block for seconds, so the pipeline runs in a
+        # worker thread and the event loop stays free for other requests.
+        await file.seek(0)
+        doc_id = await asyncio.to_thread(run_ingest_stream, file.file)
+
+        # Ingestion wipes the vector store (stateless mode), so any cached answers for
+        # previously ingested documents no longer reflect what retrieval would return.
+        qa_cache.clear()
+        qa_semantic_cache.clear()
+        scenario_cache.clear()
 
         # Return the doc_id so the frontend can reference the newly ingested document.
         return {"doc_id": doc_id, "filename": file.filename}
 
+    except HTTPException:
+        # Deliberate HTTP errors raised above (e.g., bad PDF header) keep their status code
+        # instead of being rewrapped as a 500 by the catch-all below.
+        raise
+
     except ValueError as ve:
         # This catches ingestion-level validation errors (e.g., keyword checks, schema checks,
         # or any intentional rejection where the document is considered "invalid" for the app).
@@ -100,7 +168,7 @@ router_summary = APIRouter()
 
 
 @router_summary.post("/{doc_id}")
-async def post_summary(doc_id: str) -> dict:
+async def post_summary(doc_id: str) -> Response:
     """
     Run the full document summarization pipeline for the given document.
 
@@ -111,17 +179,19 @@ async def post_summary(doc_id: str) -> dict:
         doc_id: The document identifier returned by /ingest.
 
     Returns:
-        dict: A JSON-serializable dict representation of the summary Pydantic model.
+        Response: JSON representation of the summary Pydantic model.
     """
     try:
         # Delegate to the summarization pipeline which should:
         # - retrieve relevant chunks per section
         # - call the LLM to summarize/extract structured data
         # - assemble the final multi-section summary object
-        summary = run_full_summary_pipeline(doc_id)
+        # The pipeline blocks on LLM calls for seconds, so it runs in a worker thread
+        # instead of on the event loop.
+        summary = await asyncio.to_thread(run_full_summary_pipeline, doc_id)
 
-        # Convert the Pydantic model output into a standard dict for JSON response.
-        return summary.model_dump()
+        # Serialize the Pydantic model output straight to JSON.
+        return _model_response(summary)
     except Exception as e:
         # Debug printing: in development, forcing a traceback helps reveal the true error
         # in terminal logs rather than only returning the exception string to the client.
@@ -132,7 +202,7 @@ async def post_summary(doc_id: str) -> dict:
 
 
 @router_summary.post("/{doc_id}/section/{section_id}")
-async def post_section_summary(doc_id: str, section_id: str) -> dict:
+async def post_section_summary(doc_id: str, section_id: str) -> Response:
     """
     Generate a detailed summary ("Deep Dive") for a single section of the document.
 
@@ -141,13 +211,13 @@ async def post_section_summary(doc_id: str, section_id: str) -> dict:
 
     Args:
         doc_id: The document identifier returned by /ingest.
-        section_id: One of the allowed core section ids (validated against CORE_SECTIONS).
+        section_id: One of the allowed core section ids (validated against CORE_SECTIONS_SET).
 
     Returns:
-        dict: A JSON-serializable dict representation of the section summary Pydantic model.
+        Response: JSON representation of the section summary Pydantic model.
     """
     # Reject unknown section ids early with a client-friendly message.
-    if section_id not in CORE_SECTIONS:
+    if section_id not in CORE_SECTIONS_SET:
         raise HTTPException(status_code=400, detail="Invalid section ID")
 
     try:
@@ -159,8 +229,8 @@ async def post_section_summary(doc_id: str, section_id: str) -> dict:
         # The summarizer should be grounded in the retrieved chunks.
         out = summarize_section(section_id, chunks, detail_level="detailed")
 
-        # Convert the Pydantic model output into a dict for JSON response.
-        return out.model_dump()
+        # Serialize the Pydantic model output straight to JSON.
+        return _model_response(out)
     except Exception as e:
         # Unexpected failure while retrieving/summarizing for this section.
         raise HTTPException(status_code=500, detail=str(e))
@@ -183,19 +253,20 @@ class QABody(BaseModel):
 
 
 @router_qa.post("/{doc_id}")
-async def ask_endpoint(doc_id: str, body: QABody) -> dict:
+async def ask_endpoint(doc_id: str, body: QABody) -> Response:
     """
     Answer a user question for the given document using the unified Q&A router.
 
     The `route_question` function is responsible for classifying/routing the question
     (e.g., standard QA vs scenario vs deep-dive) and returning a structured response.
+    Responses are memoized per (doc_id, normalized question) in `qa_cache`.
 
     Args:
         doc_id: The document identifier returned by /ingest.
         body: JSON request body containing the question.
 
     Returns:
-        dict: A JSON-serializable dict representation of the Q&A response Pydantic model.
+        Response: JSON representation of the Q&A response Pydantic model.
     """
     # Defensive normalization: strip whitespace and guard against empty strings.
     question = (body.question or "").strip()
@@ -203,6 +274,12 @@ async def ask_endpoint(doc_id: str, body: QABody) -> dict:
         # 400 indicates the client did not provide a required input field.
         raise HTTPException(status_code=400, detail="Question is required")
 
+    # Exact-match cache: repeated questions (after case/whitespace normalization)
+    # skip retrieval and the LLM call entirely.
+    cached = qa_cache.get(doc_id, question)
+    if cached is not None:
+        return _model_response(cached)
+
     try:
         # Delegate to the unified question router, which encapsulates:
         # - intent detection / classification
@@ -210,9 +287,10 @@ async def ask_endpoint(doc_id: str, body: QABody) -> dict:
         # - answer generation
         # - structured response assembly
         response_obj = route_question(doc_id, question)
+        qa_cache.put(doc_id, question, response_obj)
 
-        # Convert the Pydantic model output into a dict for JSON response.
-        return response_obj.model_dump()
+        # Serialize the Pydantic model output straight to JSON.
+        return _model_response(response_obj)
     except Exception as e:
         # Catch-all server error: return 500 so the UI can show a generic failure state.
         raise HTTPException(status_code=500, detail=str(e))
@@ -264,7 +342,7 @@ async def evaluate(doc_id: str) -> dict:
         dict: A JSON-serializable dict of evaluation results.
     """
     try:
-        # Delegate to the evaluation runner; expected to return a dict.
-        return run_all_evaluations(doc_id)
+        # Delegate to the evaluation runner (in a worker thread); expected to return a dict.
+        return await asyncio.to_thread(run_all_evaluations, doc_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
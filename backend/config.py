@@ -18,6 +18,10 @@ Usage:
     settings.llm_model
     settings.vector_db_path
 
+    from backend.config import get_openai_client
+
+    client = get_openai_client()  # shared, connection-pooled OpenAI client
+
 Security principles:
 - No secrets are hardcoded.
 - OPENAI_API_KEY is required and must be non-empty.
@@ -28,7 +32,8 @@ Security principles:
 from functools import lru_cache
 from pathlib import Path
 
-from pydantic import Field, field_validator
+from openai import OpenAI
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -48,6 +53,8 @@ class Settings(BaseSettings):
         EMBEDDING_MODEL
         LLM_MODEL
         VECTOR_DB_PATH
+        MAX_UPLOAD_BYTES
+        MAX_RETRIEVAL_DISTANCE
 
     Environment variable names are case-insensitive due to configuration.
     """
@@ -88,6 +95,24 @@ class Settings(BaseSettings):
         description="Directory for Chroma persistence (VECTOR_DB_PATH). Use empty for in-memory.",
     )
 
+    # Upper bound on an accepted PDF upload, in bytes (50 MiB by default).
+    # Enforced from the Content-Length header before the request body is read.
+    max_upload_bytes: int = Field(
+        default=50 * 1024 * 1024,
+        gt=0,
+        description="Maximum accepted upload size in bytes (MAX_UPLOAD_BYTES).",
+    )
+
+    # Q&A answers "not found" without an LLM call when even the best retrieved chunk is
+    # farther than this from the question. Chroma's default space is squared L2, which
+    # for unit-length OpenAI embeddings equals 2 - 2 * cosine; 1.75 is cosine < 0.125,
+    # i.e. text that is unrelated to the question.
+    max_retrieval_distance: float = Field(
+        default=1.75,
+        gt=0,
+        description="Maximum vector distance of the top chunk for Q&A to call the LLM (MAX_RETRIEVAL_DISTANCE).",
+    )
+
     @field_validator("openai_api_key", mode="before")
     @classmethod
     def strip_api_key(cls, v: str | None) -> str:
@@ -124,6 +149,10 @@ class Settings(BaseSettings):
 
         return v.strip()
 
+    # Memoized result of `get_vector_db_path_resolved`.
+    # Resolving a path hits the filesystem (realpath), so we only do it once per instance.
+    _resolved_vector_db_path: Path | None = PrivateAttr(default=None)
+
     def get_vector_db_path_resolved(self) -> Path:
         """
         Return `vector_db_path` as a fully resolved Path object.
@@ -133,13 +162,18 @@ class Settings(BaseSettings):
         - Performing filesystem operations
         - Avoiding ambiguity with relative paths
 
+        The resolved path is computed on first use and cached on the instance,
+        so repeated calls do not re-run `Path.resolve()`.
+
         Returns:
             pathlib.Path: Absolute, resolved filesystem path.
         """
-        return Path(self.vector_db_path).resolve()
+        if self._resolved_vector_db_path is None:
+            self._resolved_vector_db_path = Path(self.vector_db_path).resolve()
+        return self._resolved_vector_db_path
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Return a cached Settings instance.
@@ -150,11 +184,33 @@ def get_settings() -> Settings:
     - Guarantees consistent settings across modules.
 
     Because of `@lru_cache`, repeated calls to `get_settings()`
-    will return the same in-memory Settings instance.
+    will return the same in-memory Settings instance. The resolved vector DB
+    path is computed here as well, so callers on the hot path never pay for it.
 
     Usage:
 
         from backend.config import get_settings
         settings = get_settings()
     """
-    return Settings()
\ No newline at end of file
+    settings = Settings()
+    settings.get_vector_db_path_resolved()
+    return settings
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """
+    Return a cached OpenAI client built from the current settings.
+
+    Why caching?
+    - Constructing `OpenAI(...)` builds a fresh HTTP client (and TLS context) every time.
+    - A single shared client keeps its keep-alive connection pool across requests, so
+      consecutive LLM calls skip repeated TCP/TLS handshakes.
+    - The client is safe to share across threads (e.g., FastAPI's threadpool).
+
+    Usage:
+
+        from backend.config import get_openai_client
+        client = get_openai_client()
+    """
+    return OpenAI(api_key=get_settings().openai_api_key)
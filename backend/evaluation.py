@@ -44,17 +44,35 @@ Notes:
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from backend import storage
-from backend.schemas import SectionSummaryWithConfidence
+from backend.schemas import Chunk, ExtractedPage, PolicySummaryOutput, SectionSummaryWithConfidence
 
 # --- Constants & Patterns ---
 
 USER_FACING_CITATION_FORMAT = "(p. {page})"
 
-SENTENCE_PATTERN = re.compile(r"[.!?]+")
+# One sentence body (used with `findall`, not as a splitter): a maximal run of non-terminal
+# characters ([^.!?]) that contains at least one non-whitespace character. Counting matches
+# gives the number of non-empty segments between runs of terminal punctuation, without
+# building the list of split fragments.
+SENTENCE_BODY_PATTERN = re.compile(r"[^.!?]*[^.!?\s][^.!?]*")
+
+# Tokenizers used by the faithfulness and readability metrics. These run once per
+# bullet/chunk pair and over the whole document text, so they are compiled once here.
+# Alphanumeric tokens ([a-z0-9]+ on lowercased text) are split with a byte translation
+# table instead of a regex: every byte other than a-z/0-9 becomes a space.
+TOKEN_BYTE_TABLE = bytes(b if (48 <= b <= 57 or 97 <= b <= 122) else 32 for b in range(256))
+NUMBER_PATTERN = re.compile(r"\d+\.?\d*")
+WORD_PATTERN = re.compile(r"\b\w+\b")
+
+# Memo size for per-text tokenization. Faithfulness checks every bullet against each of its
+# citations (and a chunk is often cited by several bullets), so the same bullet and chunk
+# texts are tokenized repeatedly within one evaluation and across repeated evaluations.
+TEXT_FEATURE_CACHE_SIZE = 2048
 
 CONTEXT_KEYWORDS: set[str] = {
     "copay", "copayment", "coinsurance", "deductible", "premium", "maximum", "max",
@@ -74,16 +92,29 @@ SECTION_WEIGHTS: dict[str, float] = {
     "Claims, Appeals & Member Rights": 0.05,
 }
 
+# Normalizer for the weighted completeness score (guarded so it is never zero).
+TOTAL_SECTION_WEIGHT: float = sum(SECTION_WEIGHTS.values()) or 1.0
+
 
 # --- Internal Helpers ---
 
+def _load_or_none(loader: Callable[[str, Path | None], Any], doc_id: str, base_path: Path | None) -> Any:
+    """
+    Load a stored artifact via `loader`, returning None when it does not exist.
+    """
+    try:
+        return loader(doc_id, base_path)
+    except FileNotFoundError:
+        return None
+
+
 def _count_sentences(text: str) -> int:
     """
     Count sentence-like segments in text.
     """
-    if not text or not text.strip():
+    if not text:
         return 0
-    return len([p for p in SENTENCE_PATTERN.split(text.strip()) if p.strip()])
+    return len(SENTENCE_BODY_PATTERN.findall(text))
 
 
 def _section_addressed(sec: SectionSummaryWithConfidence) -> bool:
@@ -99,26 +130,35 @@ def _section_addressed(sec: SectionSummaryWithConfidence) -> bool:
     return any(b.citations for b in sec.bullets)
 
 
-def _normalize_tokens(text: str) -> set[str]:
+@lru_cache(maxsize=TEXT_FEATURE_CACHE_SIZE)
+def _normalize_tokens(text: str) -> frozenset[str]:
     """
     Normalize text into a set of alphanumeric lowercase tokens.
+
+    Equivalent to `re.findall(r"[a-z0-9]+", text.lower())`, but done as C-level
+    encode/translate/split passes. Non-ASCII characters are encoded as "?" and therefore
+    act as separators, exactly as they do for the regex.
+
+    Memoized per text; the result is immutable so cached sets can be shared safely.
     """
-    return set(re.findall(r"[a-z0-9]+", (text or "").lower()))
+    lowered = (text or "").lower().encode("ascii", "replace")
+    return frozenset(lowered.translate(TOKEN_BYTE_TABLE).decode("ascii").split())
 
 
-def _extract_numbers(text: str) -> set[str]:
+@lru_cache(maxsize=TEXT_FEATURE_CACHE_SIZE)
+def _extract_numbers(text: str) -> frozenset[str]:
     """
-    Extract numeric substrings from text.
+    Extract numeric substrings from text (memoized per text).
     """
-    return set(re.findall(r"\d+\.?\d*", text or ""))
+    return frozenset(NUMBER_PATTERN.findall(text or ""))
 
 
-def _extract_context_keywords(text: str) -> set[str]:
+@lru_cache(maxsize=TEXT_FEATURE_CACHE_SIZE)
+def _extract_context_keywords(text: str) -> frozenset[str]:
     """
-    Extract domain-specific context keywords from text.
+    Extract domain-specific context keywords from text (memoized per text).
     """
-    tokens = _normalize_tokens(text)
-    return {t for t in tokens if t in CONTEXT_KEYWORDS}
+    return _normalize_tokens(text) & CONTEXT_KEYWORDS
 
 
 def _number_has_matching_context(
@@ -149,27 +189,38 @@ def _chunk_supports_bullet(bullet_text: str, chunk: Any, min_overlap: float = 0.
     """
     Verify whether a chunk plausibly supports a summary bullet.
     """
-    bullet_tokens = _normalize_tokens(bullet_text)
-    chunk_text = getattr(chunk, "chunk_text", "") or ""
-    chunk_tokens = _normalize_tokens(chunk_text)
+    return _text_supports_bullet(bullet_text, getattr(chunk, "chunk_text", "") or "", min_overlap)
 
-    if not bullet_tokens:
-        return True
 
-    if len(bullet_tokens & chunk_tokens) / len(bullet_tokens) >= min_overlap:
-        return True
+def _chunk_contradicts_bullet(bullet_text: str, chunk: Any) -> bool:
+    """
+    Verify whether a chunk contradicts a summary bullet using numeric mismatch rules.
+    """
+    return _text_contradicts_bullet(bullet_text, getattr(chunk, "chunk_text", "") or "")
+
 
+def _text_supports_bullet(bullet_text: str, chunk_text: str, min_overlap: float = 0.15) -> bool:
+    """
+    Verify whether chunk text plausibly supports a summary bullet.
+
+    The numeric check runs first: it exits immediately for bullets without numbers, and
+    a numeric match in context makes the token-overlap computation unnecessary.
+    """
     if _number_has_matching_context(bullet_text, chunk_text):
         return True
 
-    return False
+    bullet_tokens = _normalize_tokens(bullet_text)
+    if not bullet_tokens:
+        return True
 
+    chunk_tokens = _normalize_tokens(chunk_text)
+    return len(bullet_tokens & chunk_tokens) / len(bullet_tokens) >= min_overlap
 
-def _chunk_contradicts_bullet(bullet_text: str, chunk: Any) -> bool:
+
+def _text_contradicts_bullet(bullet_text: str, chunk_text: str) -> bool:
     """
-    Verify whether a chunk contradicts a summary bullet using numeric mismatch rules.
+    Verify whether chunk text contradicts a summary bullet using numeric mismatch rules.
     """
-    chunk_text = getattr(chunk, "chunk_text", "") or ""
     bullet_nums = _extract_numbers(bullet_text)
 
     if bullet_nums and not _number_has_matching_context(bullet_text, chunk_text):
@@ -182,7 +233,7 @@ def _count_words(text: str) -> int:
     """
     Count words using regex.
     """
-    return len(re.findall(r"\b\w+\b", text or ""))
+    return len(WORD_PATTERN.findall(text or ""))
 
 
 def _estimate_syllables(word: str) -> int:
@@ -213,7 +264,7 @@ def _count_syllables(text: str) -> int:
     """
     Estimate total syllables in text.
     """
-    words = re.findall(r"\b\w+\b", text or "")
+    words = WORD_PATTERN.findall(text or "")
     return sum(_estimate_syllables(w) for w in words)
 
 
@@ -304,17 +355,29 @@ def compute_faithfulness(doc_id: str, base_path: Path | None = None) -> dict[str
     """
     Compute faithfulness score for a document summary.
     """
-    try:
-        summary = storage.load_policy_summary(doc_id, base_path)
-        chunks_list = storage.load_chunks(doc_id, base_path)
-    except FileNotFoundError:
+    summary = _load_or_none(storage.load_policy_summary, doc_id, base_path)
+    chunks_list = _load_or_none(storage.load_chunks, doc_id, base_path) if summary is not None else None
+    return _faithfulness_report(doc_id, summary, chunks_list)
+
+
+def _faithfulness_report(
+    doc_id: str,
+    summary: PolicySummaryOutput | None,
+    chunks_list: list[Chunk] | None,
+) -> dict[str, Any]:
+    """
+    Compute faithfulness from already-loaded artifacts (None means the artifact is missing).
+    """
+    if summary is None or chunks_list is None:
         return {
             "doc_id": doc_id,
             "error": "data_missing",
             "faithfulness_score": 0.0,
         }
 
-    chunks_by_id = {c.chunk_id: c for c in chunks_list}
+    # Flat chunk_id -> text view of the chunks. Scoring only ever needs the text, so the
+    # citation loop works on plain strings instead of reaching into Chunk models.
+    chunk_text_by_id = {c.chunk_id: c.chunk_text or "" for c in chunks_list}
 
     total_units = 0
     hallucinated_units = 0
@@ -338,8 +401,7 @@ def compute_faithfulness(doc_id: str, base_path: Path | None = None) -> dict[str
             }
 
             for cit in b.citations:
-                ch = chunks_by_id.get(cit.chunk_id)
-                chunk_text = getattr(ch, "chunk_text", "") if ch else ""
+                chunk_text = chunk_text_by_id.get(cit.chunk_id)
 
                 citation_debug = {
                     "chunk_id": cit.chunk_id,
@@ -347,23 +409,22 @@ def compute_faithfulness(doc_id: str, base_path: Path | None = None) -> dict[str
                     "support_match": False,
                     "contradiction_match": False,
                     "reason": [],
-                    "chunk_preview": chunk_text[:300],
+                    "chunk_preview": (chunk_text or "")[:300],
                 }
 
-                if not ch:
+                if chunk_text is None:
                     citation_debug["reason"].append("chunk_not_found")
                     bullet_debug["citations"].append(citation_debug)
                     continue
 
-                if _chunk_contradicts_bullet(b.text, ch):
+                if _text_contradicts_bullet(b.text, chunk_text):
+                    # A contradiction is only ever a numeric mismatch / wrong-context number,
+                    # so the reason is known without re-running the numeric check.
                     is_contradictory = True
                     citation_debug["contradiction_match"] = True
+                    citation_debug["reason"].append("number_mismatch_or_wrong_context")
 
-                    bullet_nums = _extract_numbers(b.text)
-                    if bullet_nums and not _number_has_matching_context(b.text, chunk_text):
-                        citation_debug["reason"].append("number_mismatch_or_wrong_context")
-
-                if _chunk_supports_bullet(b.text, ch):
+                if _text_supports_bullet(b.text, chunk_text):
                     is_supported = True
                     citation_debug["support_match"] = True
                     citation_debug["reason"].append("supported_by_chunk")
@@ -418,9 +479,14 @@ def compute_completeness(doc_id: str, base_path: Path | None = None) -> dict[str
     """
     Compute completeness (coverage) score for a document summary.
     """
-    try:
-        summary = storage.load_policy_summary(doc_id, base_path)
-    except FileNotFoundError:
+    return _completeness_report(doc_id, _load_or_none(storage.load_policy_summary, doc_id, base_path))
+
+
+def _completeness_report(doc_id: str, summary: PolicySummaryOutput | None) -> dict[str, Any]:
+    """
+    Compute completeness from an already-loaded summary (None means it is missing).
+    """
+    if summary is None:
         return {
             "doc_id": doc_id,
             "error": "summary_missing",
@@ -429,7 +495,6 @@ def compute_completeness(doc_id: str, base_path: Path | None = None) -> dict[str
 
     section_scores = {}
     weighted_sum = 0.0
-    total_weight = sum(SECTION_WEIGHTS.values())
 
     for sec in summary.sections:
         name = sec.section_name
@@ -441,7 +506,7 @@ def compute_completeness(doc_id: str, base_path: Path | None = None) -> dict[str
 
     return {
         "doc_id": doc_id,
-        "completeness_score": round(weighted_sum / (total_weight or 1), 4),
+        "completeness_score": round(weighted_sum / TOTAL_SECTION_WEIGHT, 4),
         "section_scores": section_scores,
     }
 
@@ -460,10 +525,20 @@ def compute_simplicity(doc_id: str, base_path: Path | None = None) -> dict[str,
         - summary_flesch
         - improvement
     """
-    try:
-        pages = storage.load_extracted_pages(doc_id, base_path)
-        summary = storage.load_policy_summary(doc_id, base_path)
-    except FileNotFoundError:
+    pages = _load_or_none(storage.load_extracted_pages, doc_id, base_path)
+    summary = _load_or_none(storage.load_policy_summary, doc_id, base_path) if pages is not None else None
+    return _simplicity_report(doc_id, pages, summary)
+
+
+def _simplicity_report(
+    doc_id: str,
+    pages: list[ExtractedPage] | None,
+    summary: PolicySummaryOutput | None,
+) -> dict[str, Any]:
+    """
+    Compute simplicity from already-loaded artifacts (None means the artifact is missing).
+    """
+    if pages is None or summary is None:
         return {
             "doc_id": doc_id,
             "error": "data_missing",
@@ -509,10 +584,17 @@ def compute_simplicity(doc_id: str, base_path: Path | None = None) -> dict[str,
 def run_all_evaluations(doc_id: str, base_path: Path | None = None) -> dict[str, Any]:
     """
     Run the full evaluation suite and return a compact metrics payload.
+
+    Each stored artifact (summary, chunks, pages) is loaded once and shared by all metrics,
+    instead of every metric re-reading the summary on its own.
     """
-    f_rep = compute_faithfulness(doc_id, base_path)
-    c_rep = compute_completeness(doc_id, base_path)
-    s_rep = compute_simplicity(doc_id, base_path)
+    summary = _load_or_none(storage.load_policy_summary, doc_id, base_path)
+    chunks_list = _load_or_none(storage.load_chunks, doc_id, base_path) if summary is not None else None
+    pages = _load_or_none(storage.load_extracted_pages, doc_id, base_path)
+
+    f_rep = _faithfulness_report(doc_id, summary, chunks_list)
+    c_rep = _completeness_report(doc_id, summary)
+    s_rep = _simplicity_report(doc_id, pages, summary)
 
     return {
         "doc_id": doc_id,
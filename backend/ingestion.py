@@ -12,8 +12,9 @@ Core design goal:
   This enables downstream summarization and QA to cite evidence reliably.
 
 Operational overview:
-- `run_ingest(pdf_content)` is the primary entry point used by the API.
-- It saves the raw PDF, extracts pages, validates that the document appears to be a health
+- `run_ingest_stream(pdf_stream)` is the primary entry point used by the API; `run_ingest(pdf_content)`
+  is a bytes-based wrapper around it.
+- It streams the raw PDF to disk, extracts pages, validates that the document appears to be a health
   insurance policy (keyword-based), chunks each page, persists artifacts, and indexes chunks.
 
 Notes:
@@ -21,10 +22,12 @@ Notes:
 - Header/footer removal is both heuristic (page numbers) and statistical (repeated lines).
 """
 
+import io
 import re
 import shutil
-from collections import Counter
+from collections import Counter, deque
 from pathlib import Path
+from typing import BinaryIO
 
 import fitz  # PyMuPDF: High-performance PDF parsing
 
@@ -41,20 +44,32 @@ MAX_TOKENS = 800  # Upper limit to stay within the LLM's context window effectiv
 OVERLAP_TOKENS = 80  # Sentences shared between chunks so context isn't lost at the 'cut'
 MIN_CHUNK_CHARS = 50  # Ignore tiny fragments that lack meaningful info
 
+# --- Precompiled Patterns ---
+# These run once per page (sentence split, blank-line collapse) or once per candidate
+# header/footer line (page-number check), so they are compiled once at import.
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")  # whitespace following sentence-ending punctuation
+
+# Page-number-like lines, as one alternation so each line costs a single match:
+# "1" | "Page 1 of 10" | "5/12". Used with fullmatch on an already-normalized line.
+_PAGENUM_RE = re.compile(r"\d+|page\s+\d+\s+of\s+\d+|\d+\s*/\s*\d+", re.I)
+_MULTI_NL_RE = re.compile(r"\n{3,}")  # runs of 3+ newlines
+
 
 # --- Policy Keywords ---
 
 # Expanded keywords based on standard health insurance document schemas.
 # These are used by `is_likely_policy` to quickly reject non-policy uploads.
+# The scan stops as soon as the threshold is met, so the terms that nearly every policy
+# contains (cost-sharing vocabulary) are listed first.
 POLICY_KEYWORDS = [
-    # General Identifiers
-    "summary of benefits", "evidence of coverage", "policy number", "group number",
-    "health care",
-
     # Financial Terms (Cost Sharing)
     "deductible", "coinsurance", "copayment", "out-of-pocket", "annual limit",
     "maximum out of pocket", "premium", "cost-sharing", "insurance", "medical",
 
+    # General Identifiers
+    "summary of benefits", "evidence of coverage", "policy number", "group number",
+    "health care",
+
     # Service Categories
     "primary care", "specialist visit", "emergency room", "urgent care",
     "inpatient hospital", "outpatient surgery", "preventive care",
@@ -72,6 +87,9 @@ POLICY_KEYWORDS = [
     #
 ]
 
+# Minimum number of distinct POLICY_KEYWORDS a document sample must contain.
+POLICY_KEYWORD_THRESHOLD = 10
+
 
 # --- Policy Checking Code ---
 def is_likely_policy(text: str) -> bool:
@@ -81,7 +99,8 @@ def is_likely_policy(text: str) -> bool:
     Current approach:
     - Lowercase the text
     - Count unique keyword matches from POLICY_KEYWORDS
-    - Accept only if the unique keyword match count meets threshold
+    - Accept as soon as the unique keyword match count meets POLICY_KEYWORD_THRESHOLD
+      (the remaining keywords are not scanned)
 
     This function is intended to be a fast guardrail to prevent ingestion of irrelevant PDFs
     (e.g., resumes, invoices, random reports), which would degrade retrieval quality.
@@ -97,33 +116,20 @@ def is_likely_policy(text: str) -> bool:
     # 1. Check for mandatory "Anchor Phrases" first
     # NOTE: Placeholder comment retained from current design; no anchor logic implemented here.
 
-    # 2. Count standard keywords (unique keyword hits)
-    matches = {word for word in POLICY_KEYWORDS if word in text_lower}
-
-    # Only pass if it has an anchor AND meets the keyword count
+    # 2. Count standard keywords (unique keyword hits), stopping once the threshold is met.
     # NOTE: "anchor" is not currently implemented; decision is solely based on keyword count.
-    is_valid = len(matches) >= 10
-
-    # Debug logging: helps tune thresholds during development.
+    matches = 0
+    for word in POLICY_KEYWORDS:
+        if word in text_lower:
+            matches += 1
+            if matches >= POLICY_KEYWORD_THRESHOLD:
+                break
+
+    # Debug logging: helps tune thresholds during development. With the early exit, a
+    # passing document reports the threshold value rather than its full keyword count.
     # (Consider routing through a logger later; intentionally left as print to preserve behavior.)
-    print(f" DEBUG: Keywords: {len(matches)}")
-    return is_valid
-
-
-def _approx_tokens(text: str) -> int:
-    """
-    Rough token estimator used for chunk sizing.
-
-    The approximation assumes ~4 characters per token, which is a common quick heuristic.
-    This avoids dependency on an actual tokenizer at ingestion time.
-
-    Args:
-        text: Input text.
-
-    Returns:
-        int: Approximate token count (non-negative).
-    """
-    return max(0, len(text.strip()) // 4)
+    print(f" DEBUG: Keywords: {matches}")
+    return matches >= POLICY_KEYWORD_THRESHOLD
 
 
 def _split_into_sentences(text: str) -> list[str]:
@@ -143,8 +149,8 @@ def _split_into_sentences(text: str) -> list[str]:
         return []
 
     # Looks for punctuation followed by space; keeps punctuation attached to preceding sentence.
-    parts = re.split(r"(?<=[.!?])\s+", text)
-    return [p.strip() for p in parts if p.strip()]
+    # Each part is stripped once (map(str.strip) runs in C) and empty parts are dropped.
+    return [p for p in map(str.strip, _SENT_SPLIT_RE.split(text)) if p]
 
 
 def _chunk_page_text(page_number: int, doc_id: str, text: str) -> list[Chunk]:
@@ -161,6 +167,7 @@ def _chunk_page_text(page_number: int, doc_id: str, text: str) -> list[Chunk]:
     - Split page text into sentences
     - Accumulate sentences until adding another would exceed MAX_TOKENS
     - Emit a chunk, then carry over a sliding-window overlap of sentences to the next chunk
+      (the window is a deque, so trimming it down to the overlap is O(dropped sentences))
 
     Args:
         page_number: 1-indexed PDF page number.
@@ -181,20 +188,25 @@ def _chunk_page_text(page_number: int, doc_id: str, text: str) -> list[Chunk]:
 
     chunks: list[Chunk] = []
 
-    # `current` accumulates the sentences for the current chunk being built.
-    current: list[str] = []
+    # `current` accumulates (sentence, token_count) pairs for the chunk being built, so
+    # each sentence is measured once and the overlap can be trimmed from the left.
+    current: deque[tuple[str, int]] = deque()
     current_tokens = 0
 
     # Chunk index is within-page; combined with page_number to form a globally unique chunk_id.
     chunk_index = 0
 
-    for sent in sentences:
-        sent_tokens = _approx_tokens(sent)
+    # Approximate token counts (~4 characters per token, a common quick heuristic that avoids
+    # a tokenizer dependency), computed once per sentence. Sentences are already stripped by
+    # `_split_into_sentences`, so plain len() is enough.
+    token_counts = [len(sent) // 4 for sent in sentences]
+
+    for sent, sent_tokens in zip(sentences, token_counts):
 
         # If adding this sentence would exceed the maximum chunk size,
         # finalize the current chunk before adding the new sentence.
         if current and current_tokens + sent_tokens > MAX_TOKENS:
-            chunk_text = " ".join(current)
+            chunk_text = " ".join(s for s, _ in current)
 
             # Emit the completed chunk with stable metadata.
             chunks.append(Chunk(
@@ -209,27 +221,19 @@ def _chunk_page_text(page_number: int, doc_id: str, text: str) -> list[Chunk]:
             # Carry a trailing slice of the previous chunk into the next chunk so that:
             # - important definitions are not separated from their context
             # - retrieval has continuity when chunk boundaries occur mid-topic
-            overlap_sentences = []
-            overlap_tokens = 0
-
-            # Walk backward through the current chunk, accumulating sentences until overlap target met.
-            for s in reversed(current):
-                overlap_tokens += _approx_tokens(s)
-                overlap_sentences.insert(0, s)
-                if overlap_tokens >= OVERLAP_TOKENS:
-                    break
-
-            # Start the new chunk with the overlap context.
-            current = overlap_sentences.copy()
-            current_tokens = overlap_tokens
+            # Drop sentences from the front while the remainder still meets the overlap target;
+            # what is left is the shortest trailing run of sentences with >= OVERLAP_TOKENS
+            # (or the whole chunk, if it is smaller than that), and starts the next chunk.
+            while current and current_tokens - current[0][1] >= OVERLAP_TOKENS:
+                current_tokens -= current.popleft()[1]
 
         # Add the sentence to the current chunk accumulator.
-        current.append(sent)
+        current.append((sent, sent_tokens))
         current_tokens += sent_tokens
 
     # Capture any remaining sentences as the final chunk.
     if current:
-        chunk_text = " ".join(current)
+        chunk_text = " ".join(s for s, _ in current)
         chunks.append(Chunk(
             chunk_id=f"c_{page_number}_{chunk_index}",
             page_number=page_number,
@@ -293,13 +297,7 @@ def _looks_like_page_number(line: str) -> bool:
     line = _normalize_line(line)
     if not line:
         return True
-    if re.match(r"^\d+$", line):
-        return True
-    if re.match(r"^page\s+\d+\s+of\s+\d+$", line, re.I):
-        return True
-    if re.match(r"^\d+\s*/\s*\d+$", line):
-        return True
-    return False
+    return _PAGENUM_RE.fullmatch(line) is not None
 
 
 def _clean_page_text(raw: str, drop_first_last_lines: bool = True) -> str:
@@ -319,25 +317,45 @@ def _clean_page_text(raw: str, drop_first_last_lines: bool = True) -> str:
         str: Cleaned page text.
     """
     # Split into individual lines; keep order for better readability.
-    lines = [ln.strip() for ln in raw.splitlines()]
+    return _clean_page_lines([ln.strip() for ln in raw.splitlines()], drop_first_last_lines)
+
+
+def _clean_page_lines(lines: list[str], drop_first_last_lines: bool = True) -> str:
+    """
+    Clean a page that is already split into stripped lines (see `_clean_page_text`).
+
+    `extract_pages` already holds every page as stripped lines, so it calls this directly
+    instead of joining the lines and having `_clean_page_text` split them again.
+
+    Args:
+        lines: Stripped page lines, in order.
+        drop_first_last_lines: Whether to heuristically strip top/bottom noise lines.
+
+    Returns:
+        str: Cleaned page text.
+    """
     if not lines:
         return ""
 
     if drop_first_last_lines:
-        # Pop lines from the top if they are short or look like page numbers.
+        # Advance past lines at the top that are short or look like page numbers.
         # This removes common headers like "Page 2 of 10" or empty lines.
-        while lines and (_looks_like_page_number(lines[0]) or len(lines[0]) < 3):
-            lines.pop(0)
+        lo, hi = 0, len(lines)
+        while lo < hi and (len(lines[lo]) < 3 or _looks_like_page_number(lines[lo])):
+            lo += 1
 
-        # Pop lines from the bottom using the same heuristics.
-        while lines and (_looks_like_page_number(lines[-1]) or len(lines[-1]) < 3):
-            lines.pop()
+        # Step back over bottom lines using the same heuristics.
+        while hi > lo and (len(lines[hi - 1]) < 3 or _looks_like_page_number(lines[hi - 1])):
+            hi -= 1
+
+        # Slice once instead of popping (list.pop(0) shifts every remaining line).
+        lines = lines[lo:hi]
 
     # Rejoin lines with newlines to preserve some structure (tables/sections).
     text = "\n".join(lines)
 
     # Collapse runs of 3+ newlines into 2 newlines to reduce whitespace without flattening structure.
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _MULTI_NL_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -363,14 +381,12 @@ def _remove_repeated_header_footer(lines_by_page: list[list[str]]) -> list[list[
     if len(lines_by_page) < 2:
         return lines_by_page
 
-    # Count occurrences of normalized lines across all pages.
-    all_lines: Counter[str] = Counter()
-    for page_lines in lines_by_page:
-        for ln in page_lines:
-            n = _normalize_line(ln)
-            # Ignore empty/very short lines that are unlikely to be meaningful.
-            if n and len(n) > 2:
-                all_lines[n] += 1
+    # Normalize every line exactly once; both the counting and the filtering passes reuse it.
+    normalized_by_page = [[_normalize_line(ln) for ln in page_lines] for page_lines in lines_by_page]
+
+    # Count occurrences of normalized lines across all pages in one Counter pass,
+    # ignoring empty/very short lines that are unlikely to be meaningful.
+    all_lines = Counter(n for page_norm in normalized_by_page for n in page_norm if len(n) > 2)
 
     # Define repetition threshold:
     # - At least 2 occurrences (avoid removing content from very short docs)
@@ -381,7 +397,10 @@ def _remove_repeated_header_footer(lines_by_page: list[list[str]]) -> list[list[
     repeated = {ln for ln, count in all_lines.items() if count > threshold}
 
     # Remove repeated lines from each page (comparison is done using normalized form).
-    return [[ln for ln in page_lines if _normalize_line(ln) not in repeated] for page_lines in lines_by_page]
+    return [
+        [ln for ln, n in zip(page_lines, page_norm) if n not in repeated]
+        for page_lines, page_norm in zip(lines_by_page, normalized_by_page)
+    ]
 
 
 def extract_pages(pdf_path: Path | str, clean_headers_footers: bool = True) -> list[ExtractedPage]:
@@ -419,61 +438,68 @@ def extract_pages(pdf_path: Path | str, clean_headers_footers: bool = True) -> l
         doc.close()
         raise ValueError(f"PDF has no pages: {path}")
 
-    pages: list[ExtractedPage] = []
-    raw_lines_by_page: list[list[str]] = []
-
     try:
-        # Iterate through each page in order.
-        for i in range(len(doc)):
-            # Convert 0-indexed i into 1-indexed page number for citations.
-            page_num = i + 1
-            page = doc[i]
-
-            # 'sort=True' encourages top-to-bottom reading order; helpful for tables/structured docs.
-            text = page.get_text("text", sort=True) or ""
-
-            # Keep per-line raw text for statistical header/footer detection.
-            raw_lines_by_page.append([ln.strip() for ln in text.splitlines()])
-
-            # Store raw page text initially; later cleaned if requested.
-            pages.append(ExtractedPage(page_number=page_num, text=text))
+        # Raw text per page, in page order.
+        # 'sort=True' encourages top-to-bottom reading order; helpful for tables/structured docs.
+        texts = [page.get_text("text", sort=True) or "" for page in doc]
     finally:
         # Always close the document handle even if extraction fails.
         doc.close()
 
-    # If cleanup is disabled (or no pages), return as-is.
-    if not clean_headers_footers or not pages:
-        return pages
+        # Release MuPDF's global resource store (fonts, images, parsed objects cached while
+        # rendering text) so that memory is returned before chunking and embedding start.
+        fitz.TOOLS.store_shrink(100)
+
+    # If cleanup is disabled, return the raw page text as-is.
+    # Page numbers are 1-indexed for citations.
+    if not clean_headers_footers:
+        return [ExtractedPage(page_number=page_num, text=text) for page_num, text in enumerate(texts, start=1)]
+
+    # Split each page into stripped lines once; the rest of the cleanup works on lines.
+    raw_lines_by_page = [[ln.strip() for ln in text.splitlines()] for text in texts]
 
     # Run statistical removal of repeated header/footer lines.
     cleaned_lines = _remove_repeated_header_footer(raw_lines_by_page)
 
-    # Reconstruct pages using cleaned lines + per-page heuristic cleanup.
-    # `zip(..., strict=True)` ensures page alignment stays correct (no silent truncation).
+    # Build the final pages straight from the cleaned lines + per-page heuristic cleanup.
     return [
-        ExtractedPage(
-            page_number=p.page_number,
-            text=_clean_page_text("\n".join(lines))
-        )
-        for p, lines in zip(pages, cleaned_lines, strict=True)
+        ExtractedPage(page_number=page_num, text=_clean_page_lines(lines))
+        for page_num, lines in enumerate(cleaned_lines, start=1)
     ]
 
 
 # --- Execution Pipeline ---
 
 def run_ingest(pdf_content: bytes, base_path: Path | None = None) -> str:
+    """
+    Run the ingestion pipeline on an in-memory PDF.
+
+    Thin wrapper around `run_ingest_stream` kept for callers (and tests) that already
+    hold the whole file as bytes.
+
+    Args:
+        pdf_content (bytes): The raw file data uploaded by the user.
+        base_path (Path, optional): Override for the default document storage directory.
+
+    Returns:
+        str: The generated doc_id, used for subsequent summary and Q&A requests.
+    """
+    return run_ingest_stream(io.BytesIO(pdf_content), base_path)
+
+
+def run_ingest_stream(pdf_stream: BinaryIO, base_path: Path | None = None) -> str:
     """
         Orchestrates the end-to-end ingestion pipeline for health insurance documents.
 
         This function manages the lifecycle of a document upload by performing the following steps:
         1. Generates a unique UUID for the session to ensure document isolation.
-        2. Saves the raw binary PDF to local persistent storage.
+        2. Streams the raw binary PDF to local persistent storage (never fully buffered in RAM).
         3. Extracts text and performs 'is_likely_policy' validation to prevent non-insurance uploads.
         4. Segments the validated text into searchable chunks and generates vector embeddings.
         5. Synchronizes the chunks with ChromaDB using strict doc_id metadata filtering.
 
         Args:
-            pdf_content (bytes): The raw file data uploaded by the user.
+            pdf_stream (BinaryIO): Readable binary file object positioned at the start of the PDF.
             base_path (Path, optional): Override for the default document storage directory.
 
         Returns:
@@ -485,8 +511,8 @@ def run_ingest(pdf_content: bytes, base_path: Path | None = None) -> str:
     # Generate a new document id to isolate this upload in storage and the vector DB.
     doc_id = storage.generate_document_id()
 
-    # Persist the raw PDF bytes so the ingestion pipeline can operate on a stable file path.
-    pdf_path = storage.save_raw_pdf(pdf_content, doc_id, base_path)
+    # Stream the raw PDF to disk so the ingestion pipeline can operate on a stable file path.
+    pdf_path = storage.save_raw_pdf_stream(pdf_stream, doc_id, base_path)
 
     try:
         # Extract pages with boundary preservation and header/footer cleanup enabled.
@@ -7,6 +7,8 @@ and registers the API routers that expose the core pipeline functionality.
 High-level responsibilities:
 - Create the FastAPI `app` instance.
 - Enable CORS so the Streamlit frontend (or any other client) can call the API.
+- Reject oversized uploads early (size-limit middleware).
+- Warm up the vector store and API clients on startup (lifespan hook).
 - Register feature routers for:
     * Ingest: PDF upload and processing
     * Summary: Full-document and section-level summarization
@@ -19,20 +21,61 @@ Notes:
   convenience. In production, this should typically be restricted to known domains.
 """
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Updated imports to match the simplified api.py.
 # Each router groups endpoints by feature area and is mounted below.
 from backend.api import (
+    limit_upload_size,
     router_ingest,
     router_summary,
     router_qa,
     router_evaluate
 )
+from backend import storage
+from backend.config import get_openai_client
+from backend.retrieval import ALL_SECTION_QUERIES
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_up() -> None:
+    """
+    Build the cached clients and collection handle ahead of the first request.
+
+    Without this, the first summary or Q&A request pays for opening the Chroma store,
+    constructing the OpenAI clients and embedding the section sub-queries. Every step is
+    best-effort: failures are logged and left for the first real request to surface.
+    """
+    try:
+        get_openai_client()
+    except Exception as e:
+        logger.warning("OpenAI client warm-up failed: %s", e)
+    storage.warm_up(ALL_SECTION_QUERIES)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: start the (blocking) warm-up in a worker thread in the background.
+
+    The warm-up makes network calls (embeddings), so it is not awaited: the server starts
+    accepting requests immediately, and a slow or unreachable OpenAI endpoint only delays
+    the warm-up itself, never startup (or `--reload`).
+    """
+    warm_up_task = asyncio.create_task(asyncio.to_thread(_warm_up))
+    yield
+    # Stop waiting on an unfinished warm-up at shutdown (the thread finishes on its own).
+    warm_up_task.cancel()
+
 
 # Create the FastAPI app instance. The title appears in the OpenAPI/Swagger UI.
-app = FastAPI(title="PolicyExplainer API")
+app = FastAPI(title="PolicyExplainer API", lifespan=lifespan)
 
 # Enable CORS so Streamlit can talk to FastAPI.
 # This is required when the frontend is served from a different origin (host/port).
@@ -44,6 +87,9 @@ app.add_middleware(
     allow_headers=["*"],   # Allow all headers (Authorization, Content-Type, etc.)
 )
 
+# Reject oversized uploads from their Content-Length header, before the body is read.
+app.middleware("http")(limit_upload_size)
+
 # Include the routers.
 # - Ingest is mounted at its internal route (e.g., POST /ingest).
 # - Summary, QA, and Evaluate are namespaced with prefixes for clarity.
@@ -22,14 +22,16 @@ Important implementation details:
 - Confidence labeling is heuristic and derived from evidence availability and citation coverage.
 """
 
+import hashlib
 import json
 import re
 from typing import Any
 
-from openai import OpenAI
+import orjson
 
 from backend import storage
-from backend.config import get_settings
+from backend.config import get_openai_client, get_settings
+from backend.qa_cache import qa_semantic_cache, scenario_cache
 from backend.retrieval import CORE_SECTIONS, retrieve_for_section
 from backend.schemas import (
     Citation,
@@ -40,7 +42,7 @@ from backend.schemas import (
     SectionSummaryWithConfidence
 )
 from backend.summarization import summarize_section
-from backend.utils import load_terminology_map, normalize_text
+from backend.utils import normalize_text
 
 # Standard "not found" answer used for user-facing responses when evidence is missing.
 NOT_FOUND_ANSWER = "I couldn't find an answer to that specific question in this policy document."
@@ -49,23 +51,108 @@ NOT_FOUND_ANSWER = "I couldn't find an answer to that specific question in this
 QA_RESPONSE_DISCLAIMER = "This explanation is for informational purposes only. Refer to official policy documents."
 
 # Regex patterns used to detect user intent for deep-dive / detailed responses.
-DETAIL_INTENT_PATTERNS = [
+# Compiled once at import so routing never goes through the `re` module's pattern cache.
+DETAIL_INTENT_PATTERNS = [re.compile(p) for p in (
     r"more\s+detail\s+about", r"in\s+more\s+detail", r"deeper\s+summary\s+of",
     r"detailed\s+summary\s+of", r"deep\s+dive\s+(?:into|on)",
-]
+)]
 
 # Substring triggers used to classify scenario-style questions.
 SCENARIO_TRIGGER_PHRASES = ["what would happen if", "example scenario", "how much would i pay if"]
 
 # Catch simple greetings before hitting the database/vector store.
 # This reduces latency and avoids expensive calls for conversational inputs.
+# The phrase lists (plain words, no regex metacharacters) are the single source for both the
+# regexes and the prefix prefilter below.
+_GREETING_WORDS = ("hi", "hello", "hey", "greetings", "good morning", "good afternoon", "good evening")
+_GREETING_QUESTIONS = ("how are you", "who are you", "what can you do")
 GREETING_PATTERNS = [
-    r"^(hi|hello|hey|greetings|good morning|good afternoon|good evening)\b",
-    r"^how are you", r"^who are you", r"^what can you do"
+    # Greeting words must end at a word boundary ("hi" but not "high deductible").
+    re.compile(r"^(" + "|".join(_GREETING_WORDS) + r")\b"),
+    *(re.compile("^" + q) for q in _GREETING_QUESTIONS),
 ]
 
+# Each intent category fused into a single alternation, so routing runs one regex search per
+# category instead of one per pattern. Categories stay separate (rather than one combined
+# regex) because routing priority is greeting > scenario > deep dive, while a single
+# alternation would return whichever pattern matches leftmost in the question.
+GREETING_RE = re.compile("|".join(p.pattern for p in GREETING_PATTERNS))
+
+# Literal prefixes of every greeting pattern. A `str.startswith` check on this tuple rejects
+# almost every real question without running the regex; the regex still confirms a match,
+# since a bare prefix would misfire on e.g. "high deductible" or "hey" inside "heyday".
+_GREETING_PREFIXES = _GREETING_WORDS + _GREETING_QUESTIONS
+DETAIL_INTENT_RE = re.compile("|".join(p.pattern for p in DETAIL_INTENT_PATTERNS))
+
+# Section-name lookup for deep-dive routing.
+# One precompiled alternation finds the first core section mentioned in a question in a
+# single regex pass, instead of a substring scan per section. Longer names are listed first
+# so the alternation always prefers the most specific match.
+_SECTION_BY_LOWER = {s.lower(): s for s in CORE_SECTIONS}
+_SECTION_RE = re.compile("|".join(re.escape(s) for s in sorted(_SECTION_BY_LOWER, key=len, reverse=True)))
+
+# System prompts, kept as module constants so every request sends a byte-identical prefix.
+# Per-request data (context, question) only ever goes in the user message that follows,
+# which lets the provider's automatic prompt-prefix caching apply.
+
+# Q&A: strict grounding, conversational handling, and JSON-only output.
+_ASK_SYS_PROMPT = """You are a strictly factual Policy Q&A system. 
+    1. Answer using ONLY the provided chunks.
+    2. If the user's input is conversational (e.g., "thanks", "ok"), respond politely and leave "citations" empty [].
+    3. If the answer is NOT in the chunks, say exactly "Not found in this document." and leave "citations" empty [].
+    4. Otherwise, provide the answer and cite your sources.
+    
+    Output ONLY valid JSON containing: 
+    {"answer": "your text", "answer_type": "answerable", "citations": [{"chunk_id": "c_1_0", "page": 1}]}
+    """
+
+# Scenarios: strict grounding, step-wise output, and JSON-only format.
+_SCENARIO_SYS_PROMPT = """You generate hypothetical cost scenarios based strictly on policy terms. 
+    Use ONLY provided chunks. If you cannot calculate a scenario based on the chunks, set "not_found" to true.
+    Output ONLY valid JSON containing: 
+    {"steps": [{"step_number": 1, "text": "description", "citations": [{"chunk_id": "c_1_0", "page": 1}]}], "not_found": false}
+    """
+
+# FAQs: plan-specific questions generated from the stored summary.
+_FAQ_SYS_PROMPT = """You are a helpful insurance assistant. Based on the provided policy summary, generate 4 to 5 Frequently Asked Questions (FAQs) that a user might have specifically about this plan.
+    Keep answers clear, accurate, and concise.
+    Output ONLY valid JSON containing a list of faqs: {"faqs": [{"question": "...", "answer": "..."}]}
+    """
+
+# Evidence token budgets for the LLM context. Chunks arrive in relevance order, so the
+# lowest-ranked ones are dropped first. Tokens are estimated as len(text) // 4, the same
+# approximation ingestion uses to size chunks (up to ~800 tokens each).
+QA_CONTEXT_MAX_TOKENS = 4000
+SCENARIO_CONTEXT_MAX_TOKENS = 3000
+
+# Shared decoder for the `_parse_llm_json` fallback (stateless, safe to reuse).
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _fit_token_budget(chunks: list[dict[str, Any]], max_tokens: int) -> list[dict[str, Any]]:
+    """
+    Keep the leading chunks that fit in an evidence token budget.
+
+    Tokens are estimated as len(text) // 4. Chunks are kept in order until the next one
+    would exceed the budget; the first chunk is always kept.
+
+    Args:
+        chunks: Chunk dicts returned from `storage.query(...)`, most relevant first.
+        max_tokens: Evidence budget in estimated tokens.
+
+    Returns:
+        list[dict[str, Any]]: The chunks that will be shown to the model.
+    """
+    kept, used = [], 0
+    for c in chunks:
+        used += len(c.get("chunk_text") or "") // 4
+        if kept and used > max_tokens:
+            break
+        kept.append(c)
+    return kept
+
 
-def _qa_build_context(chunks: list[dict[str, Any]]) -> str:
+def _qa_build_context(chunks: list[dict[str, Any]], max_tokens: int | None = None) -> str:
     """
     Build an LLM-ready context string from retrieved chunks.
 
@@ -75,19 +162,21 @@ def _qa_build_context(chunks: list[dict[str, Any]]) -> str:
     - chunk_text (the actual evidence)
 
     Args:
-        chunks: List of chunk dicts returned from `storage.query(...)`.
+        chunks: List of chunk dicts returned from `storage.query(...)`, most relevant first.
+        max_tokens: Optional evidence budget (see `_fit_token_budget`).
 
     Returns:
         str: A compact, formatted context string.
     """
-    parts = []
-    for c in chunks:
-        # Each chunk is formatted as a small block; separators help the model "see" boundaries.
-        parts.append(
-            f"---\nChunk {c.get('chunk_id', '')} (page {c.get('page_number', 0)}):\n"
-            f"{(c.get('chunk_text') or '').strip()}\n"
-        )
-    return "\n".join(parts).strip()
+    if max_tokens is not None:
+        chunks = _fit_token_budget(chunks, max_tokens)
+
+    # Each chunk is formatted as a small block; separators help the model "see" boundaries.
+    return "\n".join(
+        f"---\nChunk {c.get('chunk_id', '')} (page {c.get('page_number', 0)}):\n"
+        f"{(c.get('chunk_text') or '').strip()}\n"
+        for c in chunks
+    ).strip()
 
 
 def _parse_llm_json(raw: str) -> dict:
@@ -101,8 +190,9 @@ def _parse_llm_json(raw: str) -> dict:
 
     This function:
     1) strips fences if present
-    2) attempts direct json.loads
-    3) falls back to extracting the first {...} block via regex
+    2) attempts a direct parse (orjson, which parses in C rather than pure Python)
+    3) falls back to decoding the first JSON object starting at the first "{" with
+       `JSONDecoder.raw_decode`, which ignores any trailing prose and runs in linear time
 
     Args:
         raw: Raw text returned by the LLM.
@@ -110,23 +200,91 @@ def _parse_llm_json(raw: str) -> dict:
     Returns:
         dict: Parsed JSON object (empty dict if parsing fails).
     """
-    raw = raw.strip()
-
     # Remove common markdown code fence wrappers that break JSON parsing.
-    if raw.startswith("```json"):
-        raw = raw[7:]
-    if raw.startswith("```"):
-        raw = raw[3:]
-    if raw.endswith("```"):
-        raw = raw[:-3]
+    raw = raw.strip().lstrip("`").removeprefix("json").rstrip("`").strip()
 
     try:
         # First attempt: parse the full cleaned string.
-        return json.loads(raw.strip())
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # Fallback: decode the first object-shaped value, ignoring surrounding text.
+        idx = raw.find("{")
+        if idx < 0:
+            return {}
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(raw, idx)
+        except ValueError:
+            return {}
+        return obj if isinstance(obj, dict) else {}
+
+
+def _validate_citations(raw_citations: list[Any], allowed_ids: set[str]) -> list[Citation]:
+    """
+    Convert LLM citation dicts into Citation models, keeping only retrieved evidence.
+
+    A citation is kept when its chunk_id is in `allowed_ids` (whitelist against hallucinated
+    chunk references) and its page coerces to a positive int. Anything else, including
+    non-dict entries and invalid page types (None/str/etc.), is skipped.
+
+    Args:
+        raw_citations: The "citations" list from the parsed LLM output.
+        allowed_ids: Chunk IDs that were actually retrieved for this request.
+
+    Returns:
+        list[Citation]: Valid citations in model order.
+    """
+    citations = []
+    for c in raw_citations:
+        if not isinstance(c, dict):
+            continue
+        c_id = c.get("chunk_id")
+        if c_id not in allowed_ids:
+            continue
+        try:
+            page_num = int(c.get("page", 0))
+        except (ValueError, TypeError):
+            continue
+        if page_num > 0:
+            citations.append(Citation(page=page_num, chunk_id=str(c_id)))
+    return citations
+
+
+def _retrieval_is_weak(chunks: list[dict[str, Any]]) -> bool:
+    """
+    Return True when even the best retrieved chunk is too far from the query to help.
+
+    `storage.query` returns chunks nearest-first, so only the first distance is checked.
+    Chunks without a distance are never treated as weak.
+
+    Args:
+        chunks: Chunk dicts returned from `storage.query(...)`.
+
+    Returns:
+        bool: True if the LLM call can be skipped and "not found" returned directly.
+    """
+    distance = chunks[0].get("distance") if chunks else None
+    return distance is not None and distance > get_settings().max_retrieval_distance
+
+
+def _embed_question(question: str) -> list[float] | None:
+    """
+    Embed a question for the semantic answer cache.
+
+    Embedding failures are not fatal: the caller simply skips the cache and lets
+    retrieval embed the query itself.
+
+    Args:
+        question: Stripped user question.
+
+    Returns:
+        list[float] | None: Question embedding, or None if it is empty or embedding failed.
+    """
+    if not question:
+        return None
+    try:
+        return storage.embed_query(question)
     except Exception:
-        # Fallback: attempt to recover an object-shaped substring.
-        match = re.search(r"(\{.*\})", raw, re.DOTALL)
-        return json.loads(match.group(1)) if match else {}
+        return None
 
 
 def handle_greeting(doc_id: str, question: str) -> QAResponseOutput:
@@ -158,7 +316,8 @@ def ask(doc_id: str, question: str, top_k: int = 6) -> QAResponseOutput:
     Standard grounded RAG Q&A for a policy document.
 
     Steps:
-    1) Normalize the question.
+    1) Normalize the question and return a cached answer for a semantically equivalent
+       earlier question, if any (see `qa_cache.SemanticQueryCache`).
     2) Retrieve top_k relevant chunks from vector store.
     3) Build an evidence context string.
     4) Ask the LLM to answer using ONLY that context, requesting JSON output.
@@ -166,6 +325,9 @@ def ask(doc_id: str, question: str, top_k: int = 6) -> QAResponseOutput:
     6) Strictly filter citations to only allow retrieved chunk IDs (whitelist).
     7) Assign heuristic confidence based on citation presence and retrieval breadth.
 
+    Retrieval that returns no chunks, or only chunks farther than
+    `settings.max_retrieval_distance`, short-circuits to a not_found answer without an LLM call.
+
     Args:
         doc_id: Document identifier.
         question: User question.
@@ -177,16 +339,21 @@ def ask(doc_id: str, question: str, top_k: int = 6) -> QAResponseOutput:
     # Normalize question to avoid empty strings and accidental whitespace-only queries.
     question = (question or "").strip()
 
+    # Paraphrased repeats of an earlier question reuse its answer and skip both the vector
+    # query and the chat completion. The embedding is passed on to retrieval on a miss.
+    q_embedding = _embed_question(question)
+    if q_embedding is not None:
+        cached = qa_semantic_cache.get(doc_id, q_embedding)
+        if cached is not None:
+            return cached.model_copy(update={"question": question})
+
     # Retrieve relevant chunks from storage/vector DB.
     # Expected chunk schema: dict with at least chunk_id, page_number, chunk_text.
-    chunks = storage.query(doc_id, question, top_k=top_k)
+    chunks = storage.query(doc_id, question, top_k=top_k, query_embedding=q_embedding)
 
-    # Build a whitelist of allowed chunk IDs for strict citation filtering later.
-    # This prevents hallucinated citations that do not correspond to retrieved evidence.
-    allowed_ids = {str(c.get("chunk_id")) for c in chunks if c.get("chunk_id")}
-
-    # If retrieval returns nothing, immediately return a not_found response.
-    if not chunks:
+    # If retrieval returns nothing (or nothing close to the question), immediately return a
+    # not_found response; the model would only say "not found" after a multi-second call.
+    if not chunks or _retrieval_is_weak(chunks):
         return QAResponseOutput(
             doc_id=doc_id,
             question=question,
@@ -197,32 +364,29 @@ def ask(doc_id: str, question: str, top_k: int = 6) -> QAResponseOutput:
             disclaimer=QA_RESPONSE_DISCLAIMER
         )
 
+    # Cap the evidence to the token budget. Everything below (context, citation whitelist,
+    # confidence) uses only the chunks the model actually sees.
+    chunks = _fit_token_budget(chunks, QA_CONTEXT_MAX_TOKENS)
+
+    # Build a whitelist of allowed chunk IDs for strict citation filtering later.
+    # This prevents hallucinated citations that do not correspond to retrieved evidence.
+    allowed_ids = {str(c.get("chunk_id")) for c in chunks if c.get("chunk_id")}
+
     # Convert chunks to an LLM-readable context.
     context = _qa_build_context(chunks)
 
     # Load runtime settings (API key, model name, etc.) from environment.
     settings = get_settings()
 
-    # Initialize OpenAI client with API key (never log or expose).
-    client = OpenAI(api_key=settings.openai_api_key)
-
-    # System prompt enforces strict grounding, conversational handling, and JSON-only output.
-    system_prompt = """You are a strictly factual Policy Q&A system. 
-    1. Answer using ONLY the provided chunks.
-    2. If the user's input is conversational (e.g., "thanks", "ok"), respond politely and leave "citations" empty [].
-    3. If the answer is NOT in the chunks, say exactly "Not found in this document." and leave "citations" empty [].
-    4. Otherwise, provide the answer and cite your sources.
-    
-    Output ONLY valid JSON containing: 
-    {"answer": "your text", "answer_type": "answerable", "citations": [{"chunk_id": "c_1_0", "page": 1}]}
-    """
+    # Shared OpenAI client (cached, so the HTTP connection pool is reused across calls).
+    client = get_openai_client()
 
     # Call the model in JSON mode.
     response = client.chat.completions.create(
         model=settings.llm_model,
         response_format={"type": "json_object"},
         messages=[
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _ASK_SYS_PROMPT},
             # Provide both evidence context and the user question in one message for clarity.
             {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {question}"}
         ],
@@ -232,9 +396,6 @@ def ask(doc_id: str, question: str, top_k: int = 6) -> QAResponseOutput:
     # Parse the JSON response; defensive parsing handles occasional fence wrapping.
     parsed = _parse_llm_json(response.choices[0].message.content or "")
 
-    # Load terminology map for rewriting plan-specific terms into clearer language.
-    term_map = load_terminology_map()
-
     # Extract answer; if missing, fall back to a generic not-found.
     raw_answer = parsed.get("answer") or NOT_FOUND_ANSWER
 
@@ -245,37 +406,25 @@ def ask(doc_id: str, question: str, top_k: int = 6) -> QAResponseOutput:
         answer_text = NOT_FOUND_ANSWER
         answer_type = "not_found"
     else:
-        # Normalize answer text for readability/consistency using the term map.
-        answer_text = normalize_text(raw_answer, term_map)
+        # Normalize answer text for readability/consistency using the default term map
+        # (compiled once per process, see `utils.load_terminology_matcher`).
+        answer_text = normalize_text(raw_answer)
 
         # The model may return answer_type; default to "answerable" if absent.
         answer_type = parsed.get("answer_type", "answerable")
 
     # STRICT CITATION FILTERING:
     # Only accept citations whose chunk_id exists in `allowed_ids` (retrieved evidence).
-    citations = []
-    for c in parsed.get("citations", []):
-        c_id = c.get("chunk_id")
-
-        # Whitelist check: reject hallucinated chunk references.
-        if c_id in allowed_ids:
-            try:
-                # Normalize and validate page number.
-                page_num = int(c.get('page', 0))
-                if page_num > 0:
-                    citations.append(Citation(page=page_num, chunk_id=str(c_id)))
-            except (ValueError, TypeError):
-                # If the LLM returns invalid page types (None/str/etc.), skip citation.
-                continue
+    citations = _validate_citations(parsed.get("citations", []), allowed_ids)
 
     # Heuristic confidence:
-    # - high: citations present AND enough retrieved context
+    # - high: citations present AND enough context given to the model
     # - medium: citations present but retrieval context is thinner
     # - low: no citations
     confidence = "high" if citations and len(chunks) >= 3 else "medium" if citations else "low"
 
     # Return schema-compliant QAResponseOutput for API serialization.
-    return QAResponseOutput(
+    result = QAResponseOutput(
         doc_id=doc_id,
         question=question,
         answer=answer_text,
@@ -284,6 +433,9 @@ def ask(doc_id: str, question: str, top_k: int = 6) -> QAResponseOutput:
         confidence=confidence,
         disclaimer=QA_RESPONSE_DISCLAIMER
     )
+    if q_embedding is not None:
+        qa_semantic_cache.put(doc_id, q_embedding, result)
+    return result
 
 
 def ask_scenario(doc_id: str, question: str, scenario_type: str = "General") -> ScenarioQAResponseOutput:
@@ -311,17 +463,27 @@ def ask_scenario(doc_id: str, question: str, scenario_type: str = "General") ->
     Returns:
         ScenarioQAResponseOutput: Stepwise scenario with citations and confidence.
     """
+    # Repeats of an earlier scenario of the same type reuse its walk-through. Retrieval
+    # below does not embed the question, so the cache is exact-match rather than semantic
+    # (a semantic lookup would cost an extra embedding request on every call).
+    cache_question = f"{scenario_type}: {question}"
+    cached = scenario_cache.get(doc_id, cache_question)
+    if cached is not None:
+        return cached.model_copy(update={"question": question})
+
     # Retrieval query aims at cost-sharing language often needed for scenario calculation.
+    # It depends only on scenario_type, so its embedding is computed once per process.
     query = f"{scenario_type} deductible copay coinsurance out of pocket"
+    try:
+        query_embedding = list(storage.embed_static_query(query))
+    except Exception:
+        query_embedding = None
 
     # Retrieve a slightly larger context for scenarios, since they often require multiple facts.
-    chunks = storage.query(doc_id, query, top_k=8)
-
-    # Whitelist chunk IDs that the model is allowed to cite.
-    allowed_ids = {str(c.get("chunk_id")) for c in chunks}
+    chunks = storage.query(doc_id, query, top_k=8, query_embedding=query_embedding)
 
-    # If nothing is retrieved, return not-found scenario response immediately.
-    if not chunks:
+    # If nothing relevant is retrieved, return not-found scenario response immediately.
+    if not chunks or _retrieval_is_weak(chunks):
         return ScenarioQAResponseOutput(
             doc_id=doc_id,
             question=question,
@@ -331,25 +493,24 @@ def ask_scenario(doc_id: str, question: str, scenario_type: str = "General") ->
             disclaimer=QA_RESPONSE_DISCLAIMER
         )
 
+    # Cap the evidence to the token budget; only chunks in the context may be cited.
+    chunks = _fit_token_budget(chunks, SCENARIO_CONTEXT_MAX_TOKENS)
+
+    # Whitelist chunk IDs that the model is allowed to cite.
+    allowed_ids = {str(c.get("chunk_id")) for c in chunks}
+
     # Build formatted context for the LLM.
     context = _qa_build_context(chunks)
 
-    # Load settings and initialize OpenAI client.
+    # Load settings and the shared OpenAI client.
     settings = get_settings()
-    client = OpenAI(api_key=settings.openai_api_key)
-
-    # System prompt: enforce strict grounding, step-wise output, and JSON-only format.
-    system_prompt = """You generate hypothetical cost scenarios based strictly on policy terms. 
-    Use ONLY provided chunks. If you cannot calculate a scenario based on the chunks, set "not_found" to true.
-    Output ONLY valid JSON containing: 
-    {"steps": [{"step_number": 1, "text": "description", "citations": [{"chunk_id": "c_1_0", "page": 1}]}], "not_found": false}
-    """
+    client = get_openai_client()
 
     response = client.chat.completions.create(
         model=settings.llm_model,
         response_format={"type": "json_object"},
         messages=[
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _SCENARIO_SYS_PROMPT},
             # Provide evidence context and the scenario prompt.
             {"role": "user", "content": f"Context: {context}\nScenario: {question}"}
         ],
@@ -369,24 +530,15 @@ def ask_scenario(doc_id: str, question: str, scenario_type: str = "General") ->
             disclaimer=QA_RESPONSE_DISCLAIMER
         )
 
-    # Normalize terminology for readability and consistency.
-    term_map = load_terminology_map()
     final_steps = []
 
     # Transform model steps into Pydantic ScenarioStepOutput objects.
     for i, s in enumerate(parsed.get("steps", [])):
-        text = normalize_text(s.get("text", ""), term_map)
+        # Normalize terminology for readability and consistency.
+        text = normalize_text(s.get("text", ""))
 
         # Filter citations to only those chunk IDs that were retrieved.
-        cites = []
-        for c in s.get("citations", []):
-            if c.get("chunk_id") in allowed_ids:
-                try:
-                    p_num = int(c.get("page", 0))
-                    if p_num > 0:
-                        cites.append(Citation(page=p_num, chunk_id=c.get("chunk_id")))
-                except (ValueError, TypeError):
-                    continue
+        cites = _validate_citations(s.get("citations", []), allowed_ids)
 
         # Preserve step_number if provided; otherwise fall back to sequential numbering.
         final_steps.append(
@@ -399,7 +551,7 @@ def ask_scenario(doc_id: str, question: str, scenario_type: str = "General") ->
 
     # Confidence heuristic for scenarios:
     # More steps generally implies richer grounded coverage (though still heuristic).
-    return ScenarioQAResponseOutput(
+    result = ScenarioQAResponseOutput(
         doc_id=doc_id,
         question=question,
         scenario_type=scenario_type,
@@ -407,6 +559,8 @@ def ask_scenario(doc_id: str, question: str, scenario_type: str = "General") ->
         confidence="high" if len(final_steps) >= 3 else "medium",
         disclaimer=QA_RESPONSE_DISCLAIMER
     )
+    scenario_cache.put(doc_id, cache_question, result)
+    return result
 
 
 def _handle_section_detail(doc_id: str, question: str, section_name: str) -> QAResponseOutput:
@@ -436,14 +590,13 @@ def _handle_section_detail(doc_id: str, question: str, section_name: str) -> QAR
     # Render bullets into a readable answer string (still grounded in summary output).
     answer_text = f"Detailed overview of {section_name}:\n" + "\n".join([f"- {b.text}" for b in summary.bullets])
 
-    # Merge citations across bullets while de-duplicating by chunk_id.
-    all_citations = []
-    seen_chunks = set()
+    # Merge citations across bullets while de-duplicating by chunk_id
+    # (dicts keep insertion order, so the first citation of each chunk wins).
+    first_by_chunk: dict[str, Citation] = {}
     for b in summary.bullets:
         for c in b.citations:
-            if c.chunk_id not in seen_chunks:
-                all_citations.append(c)
-                seen_chunks.add(c.chunk_id)
+            first_by_chunk.setdefault(c.chunk_id, c)
+    all_citations = list(first_by_chunk.values())
 
     return QAResponseOutput(
         doc_id=doc_id,
@@ -477,8 +630,8 @@ def route_question(doc_id: str, question: str) -> Any:
     q_lower = (question or "").strip().lower()
 
     # 1. Catch Greetings & Small Talk First
-    # Use regex search to match greetings at the start or common small-talk patterns.
-    if any(re.search(p, q_lower) for p in GREETING_PATTERNS):
+    # A cheap prefix check screens out most questions before the anchored greeting regex runs.
+    if q_lower.startswith(_GREETING_PREFIXES) and GREETING_RE.match(q_lower):
         return handle_greeting(doc_id, question)
 
     # 2. Catch Scenario Triggers
@@ -490,18 +643,17 @@ def route_question(doc_id: str, question: str) -> Any:
 
     # 3. Catch Deep Dive Requests
     # Look for language indicating the user wants a detailed overview of a section.
-    if any(re.search(p, q_lower) for p in DETAIL_INTENT_PATTERNS):
-        # If the question contains a core section name, treat it as a section deep dive.
-        for section in CORE_SECTIONS:
-            if section.lower() in q_lower:
-                return _handle_section_detail(doc_id, question, section)
+    if DETAIL_INTENT_RE.search(q_lower):
+        # If the question mentions a core section name, treat it as a section deep dive
+        # on the first section mentioned.
+        m = _SECTION_RE.search(q_lower)
+        if m:
+            return _handle_section_detail(doc_id, question, _SECTION_BY_LOWER[m.group(0)])
 
     # 4. Standard RAG Q&A
     return ask(doc_id, question)
 
 
-# Add this to the bottom of backend/qa.py
-
 def generate_document_faqs(doc_id: str) -> dict:
     """
     Generate dynamic FAQs (4–5) based on the document's existing summary.
@@ -514,6 +666,11 @@ def generate_document_faqs(doc_id: str) -> dict:
     Fallback behavior:
     - If the summary cannot be loaded (missing or error), generate general insurance FAQs.
 
+    Caching:
+    - FAQs generated from a stored summary are persisted with an md5 of the summary context
+      (`storage.get_cached_faqs` / `storage.set_cached_faqs`) and reused until the summary
+      changes, so repeat document opens skip the LLM call.
+
     Args:
         doc_id: Document identifier.
 
@@ -522,6 +679,7 @@ def generate_document_faqs(doc_id: str) -> dict:
               {"faqs": [{"question": "...", "answer": "..."}]}
               (parsed from model output via `_parse_llm_json`).
     """
+    summary_hash = None
     try:
         # Load the summary we already generated during ingestion.
         summary = storage.load_policy_summary(doc_id)
@@ -535,28 +693,32 @@ def generate_document_faqs(doc_id: str) -> dict:
                 # Include only the top few bullets per section to fit within prompt budgets.
                 for b in sec.bullets[:3]:  # Top 3 bullets per section to save tokens
                     context += f"- {b.text}\n"
+
+        summary_hash = hashlib.md5(context.encode("utf-8")).hexdigest()
+        cached = storage.get_cached_faqs(doc_id, summary_hash)
+        if cached is not None:
+            return cached
     except Exception:
         # If anything goes wrong (missing summary, parse errors), fall back to a generic prompt.
+        summary_hash = None
         context = "No summary available. Generate general health insurance FAQs."
 
-    # Load runtime settings and initialize OpenAI client.
+    # Load runtime settings and the shared OpenAI client.
     settings = get_settings()
-    client = OpenAI(api_key=settings.openai_api_key)
-
-    system_prompt = """You are a helpful insurance assistant. Based on the provided policy summary, generate 4 to 5 Frequently Asked Questions (FAQs) that a user might have specifically about this plan.
-    Keep answers clear, accurate, and concise.
-    Output ONLY valid JSON containing a list of faqs: {"faqs": [{"question": "...", "answer": "..."}]}
-    """
+    client = get_openai_client()
 
     response = client.chat.completions.create(
         model=settings.llm_model,
         response_format={"type": "json_object"},
         messages=[
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _FAQ_SYS_PROMPT},
             {"role": "user", "content": f"Policy Summary:\n{context}"}
         ],
         temperature=0.3  # Slightly higher temperature to diversify FAQ phrasing while staying grounded.
     )
 
-    # Parse and return the JSON payload from the model response.
-    return _parse_llm_json(response.choices[0].message.content or "")
\ No newline at end of file
+    # Parse the JSON payload; only summary-grounded, non-empty results are cached.
+    faqs = _parse_llm_json(response.choices[0].message.content or "")
+    if summary_hash is not None and faqs.get("faqs"):
+        storage.set_cached_faqs(doc_id, faqs, summary_hash)
+    return faqs
\ No newline at end of file
@@ -0,0 +1,262 @@
+"""
+Q&A Response Cache: exact-match and semantic memoization for repeated questions.
+
+Interactive chat sessions repeat themselves a lot (the same question re-asked, re-sent
+after a UI rerun, or differing only in casing/whitespace). Every cache hit here skips a
+vector query and an OpenAI chat completion entirely.
+
+Design:
+- Keys are `(doc_id, sha1(normalized question))`, where normalization lowercases and
+  collapses whitespace. Hashing keeps keys small regardless of question length.
+- Entries expire after a TTL and the cache is bounded with LRU eviction
+  (`collections.OrderedDict`), so memory stays flat under load.
+- All operations hold a `threading.RLock`, because FastAPI may run handlers and their
+  sync dependencies on different threads.
+
+Semantic layer (`SemanticQueryCache`):
+- Paraphrased repeats ("what's my deductible" vs "how much is the deductible?") miss the
+  exact-match cache. The semantic cache stores `(unit question embedding, response)` per
+  doc_id and returns the stored response when cosine similarity clears a threshold.
+- The question embedding is reused for retrieval, so a miss costs no extra API call.
+  Cost scenarios retrieve with a fixed per-scenario-type query instead of the question,
+  so they have no question embedding to reuse and use the exact-match cache instead.
+- Per-doc entry counts are small, so a brute-force numpy dot product replaces an ANN index.
+
+Notes:
+- This is a per-process cache (not shared across workers/machines), in the same spirit
+  as the TTL document cache in `backend.utils`.
+- Values are stored as-is (typically Pydantic response models) and must be treated as
+  read-only by callers.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+# Maximum number of cached responses kept in memory before LRU eviction.
+QA_CACHE_MAX_SIZE = 512
+
+# Time-to-live for cached responses (seconds).
+QA_CACHE_TTL_SECONDS = 300
+
+# Minimum cosine similarity for a semantic cache hit. High enough that questions about
+# different benefits (e.g., "ER copay" vs "urgent care copay") do not collide.
+SEMANTIC_CACHE_THRESHOLD = 0.93
+
+# Maximum number of semantic entries kept per document before the oldest are dropped.
+SEMANTIC_CACHE_MAX_PER_DOC = 256
+
+# Time-to-live for semantic cache entries (seconds).
+SEMANTIC_CACHE_TTL_SECONDS = 3600
+
+
+def normalize_question(question: str) -> str:
+    """
+    Normalize a question for cache keying.
+
+    Lowercases and collapses runs of whitespace so trivially different inputs
+    ("What is my deductible?" vs "what is  my deductible? ") share a cache entry.
+
+    Args:
+        question: Raw user question.
+
+    Returns:
+        str: Normalized question text.
+    """
+    return " ".join((question or "").lower().split())
+
+
+def make_cache_key(doc_id: str, question: str) -> tuple[str, str]:
+    """
+    Build the exact-match cache key for a (doc_id, question) pair.
+
+    Args:
+        doc_id: Document identifier.
+        question: Raw user question.
+
+    Returns:
+        tuple[str, str]: (doc_id, sha1 hex digest of the normalized question).
+    """
+    digest = hashlib.sha1(normalize_question(question).encode("utf-8")).hexdigest()
+    return doc_id, digest
+
+
+class QueryCache:
+    """
+    Thread-safe LRU + TTL cache for Q&A responses.
+
+    Entries are stored as `key -> (expiry_timestamp, value)` in an OrderedDict whose
+    order tracks recency: hits are moved to the end and evictions pop from the front.
+    """
+
+    def __init__(self, max_size: int = QA_CACHE_MAX_SIZE, ttl: float = QA_CACHE_TTL_SECONDS) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, doc_id: str, question: str) -> Any | None:
+        """
+        Return the cached response for this question, or None on miss/expiry.
+        """
+        key = make_cache_key(doc_id, question)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            expiry, value = entry
+
+            # Expire entries lazily on access.
+            if time.time() > expiry:
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, doc_id: str, question: str, value: Any) -> None:
+        """
+        Store a response for this question, evicting the least recently used entry if full.
+        """
+        key = make_cache_key(doc_id, question)
+        with self._lock:
+            self._data[key] = (time.time() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def invalidate_doc(self, doc_id: str) -> None:
+        """
+        Drop every cached response belonging to `doc_id`.
+        """
+        with self._lock:
+            for key in [k for k in self._data if k[0] == doc_id]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SemanticQueryCache:
+    """
+    Thread-safe per-document nearest-neighbor cache keyed by question embeddings.
+
+    Each doc_id maps to an OrderedDict of `entry_id -> (expiry_timestamp, unit_vector, value)`
+    kept in insertion order, so the oldest entries are evicted first once a document's
+    bucket exceeds `max_per_doc`.
+    """
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_per_doc: int = SEMANTIC_CACHE_MAX_PER_DOC,
+        ttl: float = SEMANTIC_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.threshold = threshold
+        self.max_per_doc = max_per_doc
+        self.ttl = ttl
+        self._data: dict[str, OrderedDict[int, tuple[float, np.ndarray, Any]]] = {}
+        self._next_id = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _unit(embedding: Any) -> np.ndarray | None:
+        """
+        Convert an embedding to a float32 unit vector (None for empty/zero vectors).
+        """
+        vec = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm > 0.0 else None
+
+    def get(self, doc_id: str, embedding: Any, threshold: float | None = None) -> Any | None:
+        """
+        Return the response stored for the most similar cached question, or None.
+
+        Args:
+            doc_id: Document identifier.
+            embedding: Embedding of the incoming question.
+            threshold: Optional override of the instance's cosine similarity threshold.
+
+        Returns:
+            Any | None: Cached value when the best match clears the threshold.
+        """
+        vec = self._unit(embedding)
+        if vec is None:
+            return None
+
+        min_sim = self.threshold if threshold is None else threshold
+        now = time.time()
+        with self._lock:
+            bucket = self._data.get(doc_id)
+            if not bucket:
+                return None
+
+            # Expire entries lazily on access.
+            for entry_id in [k for k, (expiry, _, _) in bucket.items() if now > expiry]:
+                del bucket[entry_id]
+            if not bucket:
+                return None
+
+            values = list(bucket.values())
+            sims = np.stack([v for _, v, _ in values]) @ vec
+            best = int(np.argmax(sims))
+            if float(sims[best]) < min_sim:
+                return None
+            return values[best][2]
+
+    def put(self, doc_id: str, embedding: Any, value: Any) -> None:
+        """
+        Store a response under this question embedding.
+        """
+        vec = self._unit(embedding)
+        if vec is None:
+            return
+
+        with self._lock:
+            bucket = self._data.setdefault(doc_id, OrderedDict())
+            bucket[self._next_id] = (time.time() + self.ttl, vec, value)
+            self._next_id += 1
+            while len(bucket) > self.max_per_doc:
+                bucket.popitem(last=False)
+
+    def invalidate_doc(self, doc_id: str) -> None:
+        """
+        Drop every cached response belonging to `doc_id`.
+        """
+        with self._lock:
+            self._data.pop(doc_id, None)
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(b) for b in self._data.values())
+
+
+# Process-wide cache instance used by the Q&A API route.
+qa_cache = QueryCache()
+
+# Process-wide semantic cache for general Q&A (`qa.ask`).
+qa_semantic_cache = SemanticQueryCache()
+
+# Process-wide exact-match cache for cost scenarios (`qa.ask_scenario`), keyed on the
+# scenario type plus the question. Kept separate because it stores a different response model.
+scenario_cache = QueryCache()
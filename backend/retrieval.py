@@ -12,9 +12,11 @@ Why multi-query retrieval?
   the chance of retrieving the right evidence.
 
 Core responsibilities:
-- Define the canonical section names (CORE_SECTIONS) aligned to schemas.py literals.
+- Define the canonical section names (CORE_SECTIONS) aligned to schemas.py literals,
+  plus a frozenset view (CORE_SECTIONS_SET) for fast membership checks.
 - Define section-specific query expansions (SECTION_QUERIES).
-- Provide `retrieve_for_section(...)` to:
+- Provide `retrieve_for_section(...)` (and `retrieve_all_sections(...)`, which batches every
+  section's sub-queries into one vector query) to:
     * run multiple sub-queries against the vector store
     * deduplicate overlapping hits across queries
     * keep the best match per chunk based on vector distance
@@ -25,6 +27,8 @@ Output contract:
   "section" field indicating which section the chunk was retrieved for.
 """
 
+import heapq
+from itertools import accumulate
 from typing import Any, Final
 from backend import storage
 
@@ -42,10 +46,14 @@ CORE_SECTIONS: Final[tuple[str, ...]] = (
     "Claims, Appeals & Member Rights"  # Match Schema
 )
 
+# Hash-based view of CORE_SECTIONS for O(1) membership checks (e.g., validating a
+# section id on every API request). CORE_SECTIONS remains the ordered source of truth.
+CORE_SECTIONS_SET: Final[frozenset[str]] = frozenset(CORE_SECTIONS)
+
 # Multi-Query Mapping:
 # NLP Strategy: Instead of searching only for section titles, search for multiple
 # synonymous queries. This improves recall because policies use varied jargon.
-SECTION_QUERIES: Final[dict[str, tuple[str, ...]]] = {
+_SECTION_QUERY_TEXTS: dict[str, tuple[str, ...]] = {
     "Plan Snapshot": (
         "plan name and type",
         "summary of benefits overview",
@@ -82,12 +90,110 @@ SECTION_QUERIES: Final[dict[str, tuple[str, ...]]] = {
     ),
 }
 
+# Normalized once at import (stripped, blanks dropped) so retrieval can pass each tuple
+# straight to the vector store; the tuple also serves as the embedding cache key.
+SECTION_QUERIES: Final[dict[str, tuple[str, ...]]] = {
+    section: tuple(q.strip() for q in queries if q.strip())
+    for section, queries in _SECTION_QUERY_TEXTS.items()
+}
+
 # Retrieval tuning knobs:
 # - TOP_K_PER_QUERY: How many hits to request for each sub-query.
 # - MAX_CHUNKS_SECTION: Global cap to avoid passing too much context to the LLM.
 TOP_K_PER_QUERY = 3
 MAX_CHUNKS_SECTION = 10
 
+# Every sub-query of every section, flattened in CORE_SECTIONS order, plus each section's
+# slice into that tuple. Used by `retrieve_all_sections` to run one batched query.
+ALL_SECTION_QUERIES: Final[tuple[str, ...]] = tuple(
+    q for section in CORE_SECTIONS for q in SECTION_QUERIES.get(section, ())
+)
+_bounds = list(accumulate((len(SECTION_QUERIES.get(s, ())) for s in CORE_SECTIONS), initial=0))
+_SECTION_QUERY_SLICES: Final[dict[str, slice]] = {
+    section: slice(start, stop) for section, start, stop in zip(CORE_SECTIONS, _bounds, _bounds[1:])
+}
+
+
+def _embed_sub_queries(queries: tuple[str, ...]) -> tuple[tuple[float, ...], ...] | None:
+    """
+    Return cached embeddings for constant sub-queries, or None if embedding fails.
+
+    Sub-queries are constants, so their embeddings are computed once per process and
+    reused (see `storage.embed_static_queries`); on failure Chroma embeds the texts itself.
+
+    Args:
+        queries: Normalized sub-query texts.
+
+    Returns:
+        tuple[tuple[float, ...], ...] | None: One embedding per query, or None.
+    """
+    try:
+        return storage.embed_static_queries(queries)
+    except Exception:
+        return None
+
+
+def _merge_section_hits(
+    section_name: str,
+    results: list[list[dict[str, Any]]],
+    max_chunks: int,
+) -> list[dict[str, Any]]:
+    """
+    Deduplicate one section's sub-query hits, keep the closest per chunk, and order them.
+
+    Args:
+        section_name: Canonical section name used to annotate the returned hits.
+        results: One hit list per sub-query, as returned by `storage.query_many`.
+        max_chunks: Maximum number of chunks returned after deduping/sorting.
+
+    Returns:
+        list[dict[str, Any]]: Copied hit dicts in page order, enriched with `section`.
+    """
+    # `seen` maps chunk_id -> best hit dict so far for that chunk (not yet copied).
+    # Best is defined as the smallest vector distance (highest similarity).
+    seen: dict[str, dict[str, Any]] = {}
+
+    for hits in results:
+        for h in hits:
+            # chunk_id is the stable identifier used across the pipeline (citations, storage, etc.).
+            cid = h.get("chunk_id") or ""
+            if not cid:
+                # If a hit lacks a chunk_id, we cannot use it reliably downstream.
+                continue
+
+            # --- Deduping & Distance Logic ---
+            # If the same chunk appears for multiple queries, keep the "best" match.
+            # We define best as the smallest distance (closest in vector space).
+            # Hits are stored by reference here; only the returned ones are copied below.
+            best = seen.get(cid)
+            if best is None:
+                # First time we see this chunk_id: store it as the current best.
+                seen[cid] = h
+            else:
+                # Compare vector distance if present.
+                d = h.get("distance")
+
+                # Lower distance = higher similarity.
+                # Only update if both distances are present and the new one is better.
+                if d is not None and best.get("distance") is not None and d < best["distance"]:
+                    seen[cid] = h
+
+    # --- Sorting for Context ---
+    # Order by page_number so the LLM sees content in document order.
+    # Secondary key chunk_id provides deterministic ordering within the same page.
+    # heapq.nsmallest is equivalent to sorted(...)[:max_chunks] but only keeps the best
+    # `max_chunks` hits in a heap instead of sorting every deduplicated hit.
+    # The cap prevents overly long contexts that harm LLM performance.
+    selected = heapq.nsmallest(
+        max_chunks,
+        seen.values(),
+        key=lambda x: (x.get("page_number", 0), x.get("chunk_id", ""))
+    )
+
+    # Copy only the returned hits (storage may share hit dicts through its result cache)
+    # and annotate them with the section for downstream explainability.
+    return [{**h, "section": section_name} for h in selected]
+
 
 def retrieve_for_section(
     doc_id: str,
@@ -100,7 +206,8 @@ def retrieve_for_section(
 
     Flow:
     1) Look up the section's list of sub-queries from SECTION_QUERIES.
-    2) For each sub-query, call `storage.query(...)` against the vector store.
+    2) Run all sub-queries in one batched `storage.query_many(...)` call, using embeddings
+       of the constant sub-queries cached by `storage.embed_static_queries`.
     3) Deduplicate hits across queries by chunk_id:
         - The same chunk may be retrieved by multiple sub-queries.
         - Keep the hit with the smallest `distance` (closest vector match).
@@ -123,52 +230,43 @@ def retrieve_for_section(
     if not queries:
         return []
 
-    # `seen` maps chunk_id -> best hit dict so far for that chunk.
-    # Best is defined as the smallest vector distance (highest similarity).
-    seen: dict[str, dict[str, Any]] = {}
-
-    for q in queries:
-        # Skip accidental empty strings in query list (defensive).
-        if not q.strip():
-            continue
+    # Run every sub-query in one batched vector-store call (one Chroma round-trip instead of
+    # one per sub-query). storage.query_many returns chunk dicts with metadata and
+    # similarity info per query.
+    results = storage.query_many(
+        doc_id, list(queries), top_k=top_k_per_query, query_embeddings=_embed_sub_queries(queries)
+    )
+    return _merge_section_hits(section_name, results, max_chunks)
 
-        # storage.query connects to the underlying vector database (e.g., ChromaDB).
-        # It should return a list of dicts containing chunk metadata and similarity info.
-        hits = storage.query(doc_id, q.strip(), top_k=top_k_per_query)
 
-        for h in hits:
-            # chunk_id is the stable identifier used across the pipeline (citations, storage, etc.).
-            cid = h.get("chunk_id") or ""
-            if not cid:
-                # If a hit lacks a chunk_id, we cannot use it reliably downstream.
-                continue
+def retrieve_all_sections(
+    doc_id: str,
+    top_k_per_query: int = TOP_K_PER_QUERY,
+    max_chunks: int = MAX_CHUNKS_SECTION,
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    Retrieve evidence for every core section with a single batched vector query.
 
-            # --- Deduping & Distance Logic ---
-            # If the same chunk appears for multiple queries, keep the "best" match.
-            # We define best as the smallest distance (closest in vector space).
-            if cid not in seen:
-                # First time we see this chunk_id: store it as the current best.
-                out = dict(h)
-                out["section"] = section_name  # annotate for downstream explainability
-                seen[cid] = out
-            else:
-                # Compare vector distance if present.
-                d = h.get("distance")
+    Equivalent to calling `retrieve_for_section` for each section in CORE_SECTIONS, but all
+    sub-queries share one embedding lookup and one Chroma round-trip; results are then
+    partitioned back per section and merged exactly as `retrieve_for_section` does.
 
-                # Lower distance = higher similarity.
-                # Only update if both distances are present and the new one is better.
-                if d is not None and seen[cid].get("distance") is not None and d < seen[cid]["distance"]:
-                    out = dict(h)
-                    out["section"] = section_name
-                    seen[cid] = out
+    Args:
+        doc_id: Identifier for the ingested document (used to scope vector retrieval).
+        top_k_per_query: Number of vector hits requested per sub-query.
+        max_chunks: Maximum number of chunks returned per section.
 
-    # --- Sorting for Context ---
-    # Sort by page_number so the LLM sees content in document order.
-    # Secondary sort by chunk_id provides deterministic ordering within the same page.
-    ordered = sorted(
-        seen.values(),
-        key=lambda x: (x.get("page_number", 0), x.get("chunk_id", ""))
+    Returns:
+        dict[str, list[dict[str, Any]]]: Section name -> retrieved chunk dicts, for every
+        section in CORE_SECTIONS (in that order).
+    """
+    results = storage.query_many(
+        doc_id,
+        list(ALL_SECTION_QUERIES),
+        top_k=top_k_per_query,
+        query_embeddings=_embed_sub_queries(ALL_SECTION_QUERIES),
     )
-
-    # Cap the results to prevent overly long contexts that harm LLM performance.
-    return ordered[:max_chunks]
\ No newline at end of file
+    return {
+        section: _merge_section_hits(section, results[_SECTION_QUERY_SLICES[section]], max_chunks)
+        for section in CORE_SECTIONS
+    }
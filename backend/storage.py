@@ -18,23 +18,31 @@ This module provides two complementary storage layers used by PolicyExplainer:
 Design notes:
 - File artifacts are cached in-memory (via backend.utils cache helpers) to reduce repeated disk I/O.
 - The Chroma client is cached (lru_cache) to reuse a persistent connection to the same directory.
-- The Chroma collection is NOT cached on purpose, because the collection may be deleted/recreated
-  during ingestion (wipe_database), and caching would return a stale reference.
+- The Chroma collection handle is cached too; `wipe_database` clears that cache whenever it
+  deletes the collection, so ingestion never reuses a stale reference.
 """
 
-import json
+import logging
+import shutil
+import threading
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 from functools import lru_cache
 
 import chromadb
+import chromadb.errors
+import orjson
 from chromadb.utils import embedding_functions
 
 from backend.config import get_settings
 from backend.schemas import Chunk, ExtractedPage, PolicySummaryOutput
 from backend.utils import cache_get, cache_invalidate, cache_set
 
+logger = logging.getLogger(__name__)
+
 # --- File Paths & Constants ---
 # Base directory where document artifacts are stored.
 # Each document uses a subdirectory named by document_id.
@@ -45,10 +53,47 @@ RAW_PDF_FILENAME = "raw.pdf"
 PAGES_JSON_FILENAME = "pages.json"
 CHUNKS_JSONL_FILENAME = "chunks.jsonl"
 POLICY_SUMMARY_FILENAME = "Policy_summary.json"
+FAQS_JSON_FILENAME = "faqs.json"
+
+# Block size used when streaming uploaded PDFs to disk (1 MiB).
+RAW_PDF_COPY_BUFSIZE = 1 << 20
 
 # Chroma collection name used for storing embedded chunks.
 COLLECTION_NAME = "policy_chunks"
 
+# Chunk texts are embedded in batches of this size (one embeddings request per batch),
+# keeping each request well under the provider's per-request input/token limits.
+EMBEDDING_BATCH_SIZE = 256
+
+# Maximum number of embedding batches in flight at once during ingestion.
+EMBEDDING_MAX_WORKERS = 4
+
+# Chunks are written to Chroma in `collection.add` calls of at most this many items, which
+# keeps each write well under Chroma's maximum batch size for very long documents.
+CHROMA_ADD_BATCH_SIZE = 500
+
+# Vector query results are memoized per (doc_id, query texts, top_k): summaries, section
+# deep dives and repeated questions re-issue the same queries against an unchanged store.
+# Keys use the exact stripped query texts (no case or whitespace folding), since retrieval
+# results depend on them. LRU-bounded and cleared whenever the collection is wiped or rewritten.
+QUERY_RESULT_CACHE_SIZE = 512
+_query_result_cache: OrderedDict[tuple[str, tuple[str, ...], int], list[list[dict[str, Any]]]] = OrderedDict()
+_query_result_cache_lock = threading.Lock()
+
+# Errors Chroma raises when a cached collection handle points at a collection that has since
+# been deleted (NotFoundError on current releases, InvalidCollectionException on older ones).
+_STALE_COLLECTION_ERRORS: tuple[type[Exception], ...] = tuple(
+    exc
+    for exc in (
+        getattr(chromadb.errors, "NotFoundError", None),
+        getattr(chromadb.errors, "InvalidCollectionException", None),
+    )
+    if exc is not None
+)
+
+# Number of constant query groups whose embeddings are memoized (see `embed_static_queries`).
+STATIC_QUERY_EMBEDDING_CACHE_SIZE = 128
+
 
 # --- 1. Local File System Storage ---
 # These functions manage the physical PDF and JSON files on your hard drive.
@@ -110,6 +155,44 @@ def get_document_dir(document_id: str, base_path: Path | None = None) -> Path:
     return base / document_id
 
 
+def _file_mtime_ns(path: Path) -> int | None:
+    """
+    Return the file's modification time in nanoseconds, or None if it does not exist.
+
+    Args:
+        path: File to stat.
+
+    Returns:
+        int | None: `st_mtime_ns`, or None when the file is missing.
+    """
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _file_cache_get(cache_key: str, mtime_ns: int) -> Any | None:
+    """
+    Return a cached parse of a document file if it was cached from the same file version.
+
+    Entries are stored as `(mtime_ns, value)`. Comparing the mtime lets each worker
+    process keep its own cache while still noticing files rewritten by another worker
+    (explicit `cache_invalidate` calls only reach the process that did the write).
+
+    Args:
+        cache_key: Cache key (e.g., "chunks:<doc_id>").
+        mtime_ns: Current `st_mtime_ns` of the backing file.
+
+    Returns:
+        Any | None: Cached value, or None on miss/expiry/stale entry.
+    """
+    entry = cache_get(cache_key)
+    if entry is None:
+        return None
+    cached_mtime_ns, value = entry
+    return value if cached_mtime_ns == mtime_ns else None
+
+
 def save_raw_pdf(content: bytes, document_id: str, base_path: Path | None = None) -> Path:
     """
     Persist the raw uploaded PDF bytes to disk.
@@ -128,6 +211,28 @@ def save_raw_pdf(content: bytes, document_id: str, base_path: Path | None = None
     return path
 
 
+def save_raw_pdf_stream(stream: BinaryIO, document_id: str, base_path: Path | None = None) -> Path:
+    """
+    Persist a raw PDF to disk by streaming it from a binary file object.
+
+    Unlike `save_raw_pdf`, the full file is never held in memory: data is copied in
+    fixed-size blocks (RAW_PDF_COPY_BUFSIZE) straight from `stream` to the target file.
+
+    Args:
+        stream: Readable binary file object positioned at the start of the PDF.
+        document_id: UUID-like document identifier.
+        base_path: Optional override for the root document storage path.
+
+    Returns:
+        Path: Path to the saved PDF file.
+    """
+    doc_dir = _doc_dir(document_id, base_path)
+    path = doc_dir / RAW_PDF_FILENAME
+    with path.open("wb") as f:
+        shutil.copyfileobj(stream, f, RAW_PDF_COPY_BUFSIZE)
+    return path
+
+
 def save_extracted_pages(pages: list[ExtractedPage], document_id: str, base_path: Path | None = None) -> Path:
     """
     Persist extracted page text to disk as JSON.
@@ -144,8 +249,7 @@ def save_extracted_pages(pages: list[ExtractedPage], document_id: str, base_path
     """
     doc_dir = _doc_dir(document_id, base_path)
     path = doc_dir / PAGES_JSON_FILENAME
-    with path.open("w", encoding="utf-8") as f:
-        json.dump([p.model_dump() for p in pages], f, ensure_ascii=False, indent=2)
+    path.write_bytes(orjson.dumps([p.model_dump() for p in pages], option=orjson.OPT_INDENT_2))
     return path
 
 
@@ -171,9 +275,9 @@ def save_chunks(chunks: list[Chunk], document_id: str, base_path: Path | None =
     """
     doc_dir = _doc_dir(document_id, base_path)
     path = doc_dir / CHUNKS_JSONL_FILENAME
-    with path.open("w", encoding="utf-8") as f:
-        for c in chunks:
-            f.write(json.dumps(c.model_dump(), ensure_ascii=False) + "\n")
+    # Serialize every line with orjson and write the file in one call (one buffer, one
+    # write) instead of a json.dumps + write per chunk. orjson emits UTF-8 directly.
+    path.write_bytes(b"".join(orjson.dumps(c.model_dump()) + b"\n" for c in chunks))
 
     # Ensure any cached chunk list for this doc is cleared after write.
     cache_invalidate(f"chunks:{document_id}")
@@ -185,8 +289,8 @@ def load_chunks(document_id: str, base_path: Path | None = None) -> list[Chunk]:
     Load chunk objects from disk (chunks.jsonl), with memoization via cache helpers.
 
     Cache behavior:
-    - First checks in-memory cache
-    - If missing, reads from disk, validates via Pydantic, then caches the result
+    - First checks in-memory cache, valid only while the file's mtime is unchanged
+    - If missing or stale, reads from disk, parses/validates each line via Pydantic, then caches the result
 
     Args:
         document_id: UUID-like document identifier.
@@ -198,27 +302,27 @@ def load_chunks(document_id: str, base_path: Path | None = None) -> list[Chunk]:
     Raises:
         FileNotFoundError: If the chunks file does not exist for this document.
     """
-    cache_key = f"chunks:{document_id}"
-    cached = cache_get(cache_key)
-    if cached is not None:
-        return cached
-
     path = get_document_dir(document_id, base_path) / CHUNKS_JSONL_FILENAME
-    if not path.exists():
+    mtime_ns = _file_mtime_ns(path)
+    if mtime_ns is None:
         raise FileNotFoundError(f"No chunks found for document {document_id}: {path}")
 
-    chunks = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+    cache_key = f"chunks:{document_id}"
+    cached = _file_cache_get(cache_key, mtime_ns)
+    if cached is not None:
+        return cached
 
-            # Validate each line into a Chunk model to enforce schema integrity.
-            chunks.append(Chunk.model_validate(json.loads(line)))
+    # Read the file in one call and split the raw bytes; pydantic-core decodes each line
+    # directly into a Chunk model (UTF-8 bytes in, no text decode or intermediate dict).
+    chunks = [
+        Chunk.model_validate_json(line)
+        for line in path.read_bytes().splitlines()
+        if line.strip()
+    ]
 
-    # Cache the parsed chunk list for subsequent calls.
-    cache_set(cache_key, chunks)
+    # Cache the parsed chunk list for subsequent calls. The mtime is taken before reading,
+    # so a concurrent rewrite makes this entry stale rather than hiding the new file.
+    cache_set(cache_key, (mtime_ns, chunks))
     return chunks
 
 
@@ -240,8 +344,7 @@ def load_extracted_pages(document_id: str, base_path: Path | None = None) -> lis
     if not path.exists():
         raise FileNotFoundError(f"No extracted pages found for document {document_id}: {path}")
 
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(path.read_bytes())
 
     # Validate list items into ExtractedPage models.
     return [ExtractedPage.model_validate(item) for item in data]
@@ -264,8 +367,8 @@ def save_policy_summary(summary: PolicySummaryOutput, document_id: str, base_pat
     """
     doc_dir = _doc_dir(document_id, base_path)
     path = doc_dir / POLICY_SUMMARY_FILENAME
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(summary.model_dump(), f, ensure_ascii=False, indent=2)
+    # Same pretty-printed layout as before (2-space indent), serialized by orjson in one write.
+    path.write_bytes(orjson.dumps(summary.model_dump(), option=orjson.OPT_INDENT_2))
 
     cache_invalidate(f"summary:{document_id}")
     return path
@@ -275,6 +378,8 @@ def load_policy_summary(document_id: str, base_path: Path | None = None) -> Poli
     """
     Load a stored policy summary from disk (Policy_summary.json), with caching.
 
+    Cached entries are reused only while the file's mtime is unchanged (see `_file_cache_get`).
+
     Args:
         document_id: UUID-like document identifier.
         base_path: Optional override for the root document storage path.
@@ -285,23 +390,23 @@ def load_policy_summary(document_id: str, base_path: Path | None = None) -> Poli
     Raises:
         FileNotFoundError: If the summary file does not exist for this document.
     """
+    path = get_policy_summary_path(document_id, base_path)
+    mtime_ns = _file_mtime_ns(path)
+    if mtime_ns is None:
+        raise FileNotFoundError(f"No policy summary for document {document_id}: {path}")
+
     cache_key = f"summary:{document_id}"
-    cached = cache_get(cache_key)
+    cached = _file_cache_get(cache_key, mtime_ns)
     if cached is not None:
         return cached
 
-    path = get_policy_summary_path(document_id, base_path)
-    if not path.exists():
-        raise FileNotFoundError(f"No policy summary for document {document_id}: {path}")
-
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(path.read_bytes())
 
     # Validate JSON into the Pydantic summary model to enforce schema correctness.
     summary = PolicySummaryOutput.model_validate(data)
 
     # Cache validated object for future calls.
-    cache_set(cache_key, summary)
+    cache_set(cache_key, (mtime_ns, summary))
     return summary
 
 
@@ -319,6 +424,59 @@ def get_policy_summary_path(document_id: str, base_path: Path | None = None) ->
     return get_document_dir(document_id, base_path) / POLICY_SUMMARY_FILENAME
 
 
+def get_cached_faqs(document_id: str, summary_hash: str, base_path: Path | None = None) -> dict | None:
+    """
+    Return previously generated FAQs for this document if they match `summary_hash`.
+
+    FAQs are derived only from the stored policy summary, so they stay valid until the
+    summary content changes; a different hash means the cached FAQs are stale.
+
+    Args:
+        document_id: UUID-like document identifier.
+        summary_hash: Hash of the summary context the FAQs must have been generated from.
+        base_path: Optional override for the root document storage path.
+
+    Returns:
+        dict | None: The cached FAQ payload, or None on miss/stale/unreadable cache.
+    """
+    cache_key = f"faqs:{document_id}"
+    entry = cache_get(cache_key)
+    if entry is None:
+        path = get_document_dir(document_id, base_path) / FAQS_JSON_FILENAME
+        if not path.exists():
+            return None
+        try:
+            entry = orjson.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        cache_set(cache_key, entry)
+
+    if not isinstance(entry, dict) or entry.get("summary_hash") != summary_hash:
+        return None
+    return entry.get("faqs")
+
+
+def set_cached_faqs(document_id: str, faqs: dict, summary_hash: str, base_path: Path | None = None) -> Path:
+    """
+    Persist generated FAQs together with the hash of the summary they came from.
+
+    Args:
+        document_id: UUID-like document identifier.
+        faqs: FAQ payload as returned to the API ({"faqs": [...]}).
+        summary_hash: Hash of the summary context used to generate `faqs`.
+        base_path: Optional override for the root document storage path.
+
+    Returns:
+        Path: Path to the saved faqs.json file.
+    """
+    entry = {"summary_hash": summary_hash, "faqs": faqs}
+    path = _doc_dir(document_id, base_path) / FAQS_JSON_FILENAME
+    path.write_bytes(orjson.dumps(entry, option=orjson.OPT_INDENT_2))
+
+    cache_set(f"faqs:{document_id}", entry)
+    return path
+
+
 # --- 2. Vector Database Storage (Chroma) ---
 # These functions manage the AI's searchable memory.
 
@@ -343,6 +501,7 @@ def _get_client():
     return chromadb.PersistentClient(path=str(path))
 
 
+@lru_cache(maxsize=1)
 def _get_embedding_function():
     """
     Create the embedding function used by Chroma to embed documents and queries.
@@ -351,6 +510,9 @@ def _get_embedding_function():
     - API key from environment
     - embedding model name from settings
 
+    Like `_get_client`, the instance is cached so ingestion batches, query embeddings and
+    the collection handle all share one embedding function (and its HTTP client).
+
     Returns:
         embedding_functions.OpenAIEmbeddingFunction: Embedding callable for Chroma.
     """
@@ -361,14 +523,14 @@ def _get_embedding_function():
     )
 
 
+@lru_cache(maxsize=1)
 def _get_collection():
     """
     Retrieve (or create) the active Chroma collection.
 
-    Important:
-    - We do NOT cache the collection reference here.
-      The ingestion pipeline may delete the collection (wipe_database),
-      and caching would return a stale object.
+    The handle is cached so queries skip the `get_or_create_collection` metadata round-trip.
+    The ingestion pipeline deletes the collection (wipe_database), which calls
+    `_get_collection.cache_clear()` so the next call creates and caches a fresh handle.
 
     Returns:
         chromadb.api.models.Collection.Collection: Active collection handle.
@@ -383,6 +545,114 @@ def _get_collection():
     )
 
 
+def _embed_texts(texts: list[str]) -> list[Any]:
+    """
+    Embed a list of texts using batched embedding requests.
+
+    Texts are split into slices of EMBEDDING_BATCH_SIZE; each slice is a single call to the
+    embedding function (one HTTP request), and slices are embedded concurrently.
+    Output order matches input order.
+
+    Args:
+        texts: Texts to embed.
+
+    Returns:
+        list[Any]: One embedding vector per input text.
+    """
+    ef = _get_embedding_function()
+    batches = [texts[i: i + EMBEDDING_BATCH_SIZE] for i in range(0, len(texts), EMBEDDING_BATCH_SIZE)]
+
+    # Small documents fit in one request; skip the thread pool entirely.
+    if len(batches) <= 1:
+        return list(ef(batches[0])) if batches else []
+
+    with ThreadPoolExecutor(max_workers=min(EMBEDDING_MAX_WORKERS, len(batches))) as executor:
+        results = list(executor.map(ef, batches))
+
+    return [emb for batch in results for emb in batch]
+
+
+def embed_query(text: str) -> list[float]:
+    """
+    Embed a single query string with the same model used for stored chunks.
+
+    Callers that embed a question themselves (e.g., for the semantic answer cache) can pass
+    the vector back into `query(..., query_embedding=...)` so it is not embedded twice.
+
+    Args:
+        text: Query text.
+
+    Returns:
+        list[float]: Embedding vector.
+    """
+    return [float(x) for x in _get_embedding_function()([text.strip()])[0]]
+
+
+@lru_cache(maxsize=STATIC_QUERY_EMBEDDING_CACHE_SIZE)
+def embed_static_queries(texts: tuple[str, ...]) -> tuple[tuple[float, ...], ...]:
+    """
+    Embed a fixed, code-defined group of query strings once per process.
+
+    Retrieval prompts built from constants (section sub-queries, scenario cost queries) are
+    identical on every call, so their embeddings are memoized instead of re-requested from
+    the embeddings API. The whole group is embedded in one batched request on first use.
+    Do not use this for user text: one-off entries would evict the useful ones.
+
+    Args:
+        texts: Constant, non-blank query texts (a tuple, so it can be a cache key).
+
+    Returns:
+        tuple[tuple[float, ...], ...]: One embedding per text, in order (immutable, safe to share).
+    """
+    return tuple(tuple(float(x) for x in emb) for emb in _embed_texts([t.strip() for t in texts]))
+
+
+def embed_static_query(text: str) -> tuple[float, ...]:
+    """
+    Embed a single constant query string (see `embed_static_queries`).
+
+    Args:
+        text: Constant query text.
+
+    Returns:
+        tuple[float, ...]: Embedding vector.
+    """
+    return embed_static_queries((text,))[0]
+
+
+def warm_up(static_queries: tuple[str, ...] = ()) -> None:
+    """
+    Prime the cached Chroma client, collection handle and embedding function.
+
+    Called once at API startup so the first user request does not pay for opening the
+    SQLite store, building the embeddings HTTP client, and the first TLS handshake.
+    Embedding `static_queries` both opens that connection and fills the
+    `embed_static_queries` cache with vectors retrieval needs anyway.
+
+    Failures are logged and swallowed: a cold cache only costs latency, and the same
+    error will surface on the first real request with its normal handling.
+
+    Args:
+        static_queries: Constant query texts to pre-embed (e.g., all section sub-queries).
+    """
+    try:
+        _get_collection()
+        # Only touch the embeddings API when a key is configured; otherwise every call
+        # would just fail (after retries) with an authentication error.
+        if static_queries and get_settings().openai_api_key:
+            embed_static_queries(static_queries)
+    except Exception as e:
+        logger.warning("Vector store warm-up failed: %s", e)
+
+
+def _clear_query_result_cache() -> None:
+    """
+    Drop every memoized vector query result (the collection contents changed).
+    """
+    with _query_result_cache_lock:
+        _query_result_cache.clear()
+
+
 def wipe_database() -> None:
     """
     Delete the entire Chroma collection used for policy chunks.
@@ -393,12 +663,14 @@ def wipe_database() -> None:
 
     Side effects:
     - Deletes the collection if it exists.
-    - Prints debug messages for visibility during development.
+    - Logs a debug message (logger "backend.storage") for visibility during development.
     """
     client = _get_client()
+    _clear_query_result_cache()
+    _get_collection.cache_clear()
     try:
         client.delete_collection(COLLECTION_NAME)
-        print("🧹 DEBUG: Database completely wiped. Slate is clean.")
+        logger.debug("Vector store wiped (collection %r deleted).", COLLECTION_NAME)
     except Exception:
         # If the collection doesn't exist yet, deletion can raise an exception.
         # It is safe to ignore in that case.
@@ -414,7 +686,9 @@ def add_chunks(doc_id: str, chunks: list[Chunk]) -> None:
     2) Wipe the existing Chroma collection (stateless mode).
     3) Recreate/get an empty collection.
     4) Format chunk payloads (ids, documents, metadatas).
-    5) Add to Chroma and force a heartbeat to ensure persistence.
+    5) Embed all chunk texts in batched requests (see `_embed_texts`).
+    6) Add to Chroma in batches of CHROMA_ADD_BATCH_SIZE (PersistentClient commits each
+       `add` to disk before returning).
 
     Args:
         doc_id: Document identifier (used for metadata scoping).
@@ -434,26 +708,45 @@ def add_chunks(doc_id: str, chunks: list[Chunk]) -> None:
     # - ids: unique identifiers for each stored item
     # - documents: raw text strings
     # - metadatas: additional searchable fields (used for filtering and citation support)
-    ids = [str(c.chunk_id) for c in chunks]
-    documents = [c.chunk_text for c in chunks]
-    metadatas = [
-        {
-            "chunk_id": str(c.chunk_id),
-            "page_number": int(c.page_number),
-            "doc_id": doc_id_str  # Still tagging it for good measure
-        } for c in chunks
-    ]
-
-    # 4. Save the new document into the fresh database.
-    collection.add(ids=ids, documents=documents, metadatas=metadatas)
+    # All three lists are built in one pass over `chunks` and unzipped.
+    def _rows():
+        for c in chunks:
+            chunk_id = str(c.chunk_id)
+            yield chunk_id, c.chunk_text, {
+                "chunk_id": chunk_id,
+                "page_number": int(c.page_number),
+                "doc_id": doc_id_str,  # Still tagging it for good measure
+            }
+
+    ids, documents, metadatas = map(list, zip(*_rows()))
+
+    # 4. Embed up front in batches rather than leaving it to Chroma's single call over
+    #    every document, which can exceed per-request limits for long policies.
+    embeddings = _embed_texts(documents)
+
+    # 5. Save the new document into the fresh database. The collection was just wiped, so
+    #    there are no stale entries to delete first.
+    for i in range(0, len(ids), CHROMA_ADD_BATCH_SIZE):
+        batch = slice(i, i + CHROMA_ADD_BATCH_SIZE)
+        collection.add(
+            ids=ids[batch],
+            documents=documents[batch],
+            metadatas=metadatas[batch],
+            embeddings=embeddings[batch],
+        )
+    _clear_query_result_cache()
 
-    # 5. Force the client to "touch" the DB.
-    # This is used here as a practical way to encourage flush/sync on certain platforms.
-    _get_client().heartbeat()
-    print(f"✅ DEBUG: New document ingested. Total DB Count: {collection.count()}")
+    # count() is a separate DB call, so only run it when debug logging is actually on.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("New document ingested. Total DB count: %d", collection.count())
 
 
-def query(doc_id: str, query_text: str, top_k: int = 5) -> list[dict[str, Any]]:
+def query(
+    doc_id: str,
+    query_text: str,
+    top_k: int = 5,
+    query_embedding: list[float] | None = None,
+) -> list[dict[str, Any]]:
     """
     Query the active vector store for chunks relevant to `query_text`.
 
@@ -466,6 +759,8 @@ def query(doc_id: str, query_text: str, top_k: int = 5) -> list[dict[str, Any]]:
         doc_id: Document identifier to scope retrieval.
         query_text: Natural language query string.
         top_k: Number of top results requested from Chroma.
+        query_embedding: Optional precomputed embedding of `query_text` (see `embed_query`);
+            when given, Chroma skips its own embedding request.
 
     Returns:
         list[dict[str, Any]]: List of chunk-like dicts including:
@@ -474,55 +769,129 @@ def query(doc_id: str, query_text: str, top_k: int = 5) -> list[dict[str, Any]]:
           - doc_id
           - chunk_text
           - distance (vector distance / similarity measure)
-        If query fails, returns [].
+
+    Raises:
+        Exception: If the Chroma query fails even after refreshing the collection handle
+            (see `query_many`).
     """
     # Reject whitespace-only queries to avoid unnecessary DB calls.
     if not query_text.strip():
         return []
 
-    collection = _get_collection()
+    embeddings = [query_embedding] if query_embedding is not None else None
+    return query_many(doc_id, [query_text], top_k=top_k, query_embeddings=embeddings)[0]
+
+
+def query_many(
+    doc_id: str,
+    query_texts: list[str],
+    top_k: int = 5,
+    query_embeddings: list[Any] | None = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Run several queries against the vector store in one Chroma call.
+
+    Chroma accepts a list of query texts and returns one result list per query, and the
+    embedding function embeds all of them in a single request. This replaces N sequential
+    round-trips (embedding + ANN search) with one.
+
+    Args:
+        doc_id: Document identifier to scope retrieval.
+        query_texts: Natural language query strings. Blank entries get [] without being sent.
+        top_k: Number of top results requested from Chroma per query.
+        query_embeddings: Optional precomputed embeddings, parallel to `query_texts`;
+            when given, Chroma skips its own embedding request.
+
+    Successful results are memoized per (doc_id, query texts, top_k) until the collection
+    is wiped or rewritten; failed queries are not cached.
+
+    The collection handle is cached per process, so another worker's ingest (which deletes
+    and recreates the collection) leaves this process holding a stale handle. A query that
+    fails because the collection no longer exists drops the cached handle and is retried
+    once against a fresh one; any other error propagates immediately.
+
+    Returns:
+        list[list[dict[str, Any]]]: One hit list per input query (same order and shape as
+        `query`).
+
+    Raises:
+        Exception: Whatever Chroma (or the embedding function) raised. Errors are not turned
+            into empty results, which callers would present as "not found in the document".
+    """
+    out: list[list[dict[str, Any]]] = [[] for _ in query_texts]
+
+    # Only non-blank queries are sent; `positions` maps results back to input slots.
+    positions = [i for i, q in enumerate(query_texts) if q.strip()]
+    if not positions:
+        return out
+
+    # Identical queries against an unchanged store return identical hits.
+    cache_key = (str(doc_id), tuple(q.strip() for q in query_texts), top_k)
+    with _query_result_cache_lock:
+        cached = _query_result_cache.get(cache_key)
+        if cached is not None:
+            _query_result_cache.move_to_end(cache_key)
+    if cached is not None:
+        return [list(hits) for hits in cached]
+
     doc_id_str = str(doc_id)
 
-    # Extra safety: filter results to this document_id.
-    where_filter = {"doc_id": doc_id_str}
+    # Debug log helps diagnose query behavior (formatted lazily, only when DEBUG is enabled).
+    logger.debug("Searching vector DB for: %s", query_texts)
 
-    # Heartbeat + debug log help diagnose persistence and query behavior.
-    _get_client().heartbeat()
-    print(f"🔎 DEBUG: Searching Vector DB for: '{query_text}'")
+    if query_embeddings is not None:
+        query_args = {"query_embeddings": [list(query_embeddings[i]) for i in positions]}
+    else:
+        query_args = {"query_texts": [query_texts[i].strip() for i in positions]}
 
-    try:
+    def _run_query() -> dict[str, Any]:
         # Query the vector DB for nearest-neighbor matches.
-        results = collection.query(
-            query_texts=[query_text.strip()],
+        # Extra safety: filter results to this document_id.
+        return _get_collection().query(
+            **query_args,
             n_results=top_k,
-            where=where_filter,
+            where={"doc_id": doc_id_str},
             include=["documents", "metadatas", "distances"],
         )
 
-        # Chroma returns results as lists-of-lists (one list per query text).
-        ids = results.get("ids", [[]])[0]
-        docs = results.get("documents", [[]])[0]
-        metas = results.get("metadatas", [[]])[0]
-        dists = results.get("distances", [[]])[0]
-
-        out = []
+    try:
+        results = _run_query()
+    except _STALE_COLLECTION_ERRORS as e:
+        # A stale handle to a collection another process deleted and recreated.
+        logger.warning("ChromaDB query failed, retrying with a fresh collection handle: %s", e)
+        _get_collection.cache_clear()
+        results = _run_query()
+
+    # Chroma returns results as lists-of-lists (one list per query).
+    all_ids = results.get("ids") or []
+    all_docs = results.get("documents") or []
+    all_metas = results.get("metadatas") or []
+    all_dists = results.get("distances") or []
+
+    for row, slot in enumerate(positions):
+        ids = all_ids[row] if row < len(all_ids) else []
+        docs = all_docs[row] if row < len(all_docs) else []
+        metas = all_metas[row] if row < len(all_metas) else []
+        dists = all_dists[row] if row < len(all_dists) else []
+
+        hits = out[slot]
         for i, (cid, doc_text) in enumerate(zip(ids, docs, strict=False)):
             # Defensive indexing: metadata/distances might be shorter than ids in edge cases.
-            meta = metas[i] if i < len(metas) else {}
+            meta = (metas[i] if i < len(metas) else None) or {}
             distance = dists[i] if i < len(dists) else None
 
             # Normalize output into a stable dict shape used throughout the app.
-            out.append({
+            hits.append({
                 "chunk_id": cid,
                 "page_number": meta.get("page_number", 0),
                 "doc_id": meta.get("doc_id", doc_id),
                 "chunk_text": doc_text or "",
                 "distance": distance
             })
-        return out
 
-    except Exception as e:
-        # If Chroma throws (persistence issues, embedding errors, etc.), return empty results.
-        # Debug print preserves existing behavior and helps during development.
-        print(f"❌ DEBUG: ChromaDB Query Failed: {e}")
-        return []
\ No newline at end of file
+    with _query_result_cache_lock:
+        _query_result_cache[cache_key] = [list(hits) for hits in out]
+        _query_result_cache.move_to_end(cache_key)
+        while len(_query_result_cache) > QUERY_RESULT_CACHE_SIZE:
+            _query_result_cache.popitem(last=False)
+    return out
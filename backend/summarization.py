@@ -23,16 +23,17 @@ Key safety/quality controls:
 
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal
 
-from openai import OpenAI
+import orjson
 
 from backend import storage
-from backend.config import get_settings
+from backend.config import get_openai_client, get_settings
 from backend.evaluation import confidence_for_section, validate_section_summary
-from backend.retrieval import CORE_SECTIONS, retrieve_for_section
+from backend.retrieval import CORE_SECTIONS, retrieve_all_sections
 from backend.schemas import (
     BulletWithCitations,
     Citation,
@@ -42,7 +43,7 @@ from backend.schemas import (
     PolicySummaryOutput,
     SectionSummaryWithConfidence,  # Use the consolidated model
 )
-from backend.utils import load_terminology_map, normalize_text
+from backend.utils import normalize_text
 
 # Define DetailLevel locally as it is a specific logic toggle for the pipeline.
 # - "standard": concise summaries (fewer bullets)
@@ -54,6 +55,9 @@ DetailLevel = Literal["standard", "detailed"]
 STANDARD_MAX_BULLETS = 6
 DETAILED_MAX_BULLETS = 12
 
+# Shared decoder for the `_parse_llm_json` fallback (stateless, safe to reuse).
+_JSON_DECODER = json.JSONDecoder()
+
 SIMPLE_REPLACEMENTS = {
     r"\bprior to\b": "before",
     r"\bin the event of\b": "if",
@@ -94,7 +98,7 @@ def _build_context(chunks: list[dict[str, Any]]) -> str:
     This labeling is critical: it gives the LLM explicit identifiers to reference in JSON output.
 
     Args:
-        chunks: Retrieval hits from the vector store (storage.query / retrieve_for_section).
+        chunks: Retrieval hits from the vector store (storage.query / retrieve_for_section / retrieve_all_sections).
 
     Returns:
         str: Formatted context string or "" if chunks is empty.
@@ -125,9 +129,11 @@ def _parse_llm_json(raw: str) -> dict[str, Any] | None:
     - extra whitespace
 
     Strategy:
-    1) Attempt to extract a fenced JSON object if present.
-    2) Otherwise, slice from the first '{' to the last '}'.
-    3) Attempt json.loads; return None on decode failure.
+    1) Parse the whole response with orjson (C-level parser); this is the common case.
+    2) Otherwise, decode the single JSON object starting at the first '{' with
+       `JSONDecoder.raw_decode`. It stops at the object's matching brace, so fences and
+       trailing prose are ignored, braces inside strings are handled, and the scan is linear.
+    3) Return None if neither yields a JSON object.
 
     Args:
         raw: Raw response content string from the LLM.
@@ -137,20 +143,18 @@ def _parse_llm_json(raw: str) -> dict[str, Any] | None:
     """
     s = raw.strip()
 
-    # Prefer extracting JSON inside ```json fences if present.
-    m = re.search(r"```(?:json)?\s*(\{.*\})\s*```", s, re.DOTALL)
-    if m:
-        s = m.group(1)
-    else:
-        # Fallback: attempt to carve out the first full JSON object.
-        start, end = s.find("{"), s.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            s = s[start: end + 1]
-
     try:
-        return json.loads(s)
-    except json.JSONDecodeError:
-        return None
+        obj = orjson.loads(s)
+    except orjson.JSONDecodeError:
+        start = s.find("{")
+        if start == -1:
+            return None
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(s, start)
+        except ValueError:
+            return None
+
+    return obj if isinstance(obj, dict) else None
 
 
 def summarize_section(
@@ -179,7 +183,7 @@ def summarize_section(
         SectionSummaryWithConfidence: Validated, citation-filtered summary output.
     """
     # Build a whitelist of allowed chunk IDs. This prevents hallucinated citations.
-    allowed_ids = {str(c.get("chunk_id")) for c in chunks if c.get("chunk_id")}
+    allowed_ids = frozenset(str(cid) for c in chunks if (cid := c.get("chunk_id")))
 
     # Pre-define the "not found" state. This is returned if:
     # - no chunks were retrieved
@@ -194,16 +198,18 @@ def summarize_section(
         validation_issues=["No relevant document chunks found."]
     )
 
-    # If retrieval returned nothing, skip the LLM call.
-    if not chunks:
+    # If retrieval returned nothing citable, skip the LLM call: every bullet would be
+    # dropped for lacking a valid citation anyway.
+    if not allowed_ids:
         return empty_res
 
     # Build formatted evidence context for the model.
     context = _build_context(chunks)
 
-    # Load runtime settings and create OpenAI client.
+    # Load runtime settings and the shared OpenAI client. Sections are summarized
+    # concurrently, so one client (and its connection pool) serves every worker thread.
     settings = get_settings()
-    client = OpenAI(api_key=settings.openai_api_key)
+    client = get_openai_client()
 
     # System prompt: enforce strict JSON shape and strict grounding.
     # Note: This is intentionally minimal and structural; deeper stylistic guidance can be
@@ -262,15 +268,14 @@ def summarize_section(
         return empty_res
 
     # 1) Normalize terminology and validate citations.
-    # - Normalize bullet text for readability (plan-specific term map).
+    # - Normalize bullet text for readability (default term map, compiled once per process).
     # - Filter citations to allowed chunk IDs only.
     # - Force page to int to satisfy Pydantic typing and avoid runtime validation errors.
-    term_map = load_terminology_map()
     valid_bullets = []
 
     for b in parsed.get("bullets", []):
         # Normalize text output for consistent phrasing and expanded terminology.
-        text = normalize_text(b.get("text", ""), term_map)
+        text = normalize_text(b.get("text", ""))
 
         # Light readability-focused post-processing on bullet text only.
         text = simplify_summary_text(text)
@@ -278,14 +283,17 @@ def summarize_section(
         cites = []
         for c in b.get("citations", []):
             # Only keep citations that refer to chunks we actually retrieved.
-            if str(c.get("chunk_id")) in allowed_ids:
+            cid = c.get("chunk_id")
+            if not isinstance(cid, str):
+                cid = str(cid)
+            if cid in allowed_ids:
                 # Proactive fix: coerce page to int to avoid Pydantic type errors.
                 try:
                     page_num = int(c.get("page", 0))
                 except (ValueError, TypeError):
                     page_num = 0
 
-                cites.append(Citation(page=page_num, chunk_id=str(c.get("chunk_id"))))
+                cites.append(Citation(page=page_num, chunk_id=cid))
 
         # Only keep bullets that have at least one valid source.
         if cites:
@@ -327,11 +335,14 @@ def run_full_summary_pipeline(
 
     Steps:
     1) Load extracted pages to compute total_pages for metadata.
-    2) For each section in CORE_SECTIONS:
-        - retrieve relevant chunks via retrieve_for_section(...)
-        - summarize the section via summarize_section(...)
-    3) Construct PolicySummaryOutput payload with metadata and disclaimer.
-    4) Persist the summary to storage for later use by the frontend and FAQ generation.
+    2) Retrieve chunks for all sections at once via retrieve_all_sections(...), a single
+       batched vector query.
+    3) For each section in CORE_SECTIONS (concurrently, one worker thread per section),
+       summarize the section via summarize_section(...). Sections are independent
+       network-bound calls, so wall-clock time is roughly the slowest section rather than
+       the sum of all of them. Output order follows CORE_SECTIONS.
+    4) Construct PolicySummaryOutput payload with metadata and disclaimer.
+    5) Persist the summary to storage for later use by the frontend and FAQ generation.
 
     Args:
         doc_id: Document identifier.
@@ -349,16 +360,18 @@ def run_full_summary_pipeline(
         total_pages=total_pages
     )
 
-    # Summarize each canonical section.
-    final_sections = []
-    for section_name in CORE_SECTIONS:
-        # Fetch relevant chunks from the vector store.
-        chunks = retrieve_for_section(doc_id, section_name)
-
-        # Convert chunks into a structured summary for this section.
-        summary = summarize_section(section_name, chunks, detail_level)
-
-        final_sections.append(summary)
+    # Retrieve evidence for every section up front in one batched vector query
+    # (one embedding lookup + one Chroma round-trip instead of one per section).
+    section_chunks = retrieve_all_sections(doc_id)
+
+    # Summarize each canonical section concurrently.
+    # The OpenAI client releases the GIL while waiting on I/O, so threads are enough.
+    # `executor.map` yields results in input order, preserving CORE_SECTIONS ordering.
+    with ThreadPoolExecutor(max_workers=len(CORE_SECTIONS)) as executor:
+        final_sections = list(executor.map(
+            lambda section_name: summarize_section(section_name, section_chunks[section_name], detail_level),
+            CORE_SECTIONS,
+        ))
 
     # Build final output payload.
     full_output = PolicySummaryOutput(
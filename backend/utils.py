@@ -19,6 +19,7 @@ This module contains small, reusable helpers used across the PolicyExplainer bac
 import json
 import re
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -32,10 +33,13 @@ from typing import Any
 # }
 DEFAULT_TERMINOLOGY_PATH = Path(__file__).resolve().parent.parent / "schema" / "terminology_map.json"
 
+# Number of distinct terminology map paths kept loaded (the app itself only uses the default).
+TERMINOLOGY_CACHE_SIZE = 8
 
-def load_terminology_map(path: Path | str | None = None) -> dict[str, list[str]]:
+
+def _read_terminology_map(path: Path | str | None = None) -> dict[str, list[str]]:
     """
-    Load a canonical->synonyms terminology map from JSON.
+    Read and parse a canonical->synonyms terminology map from JSON (uncached).
 
     Behavior is intentionally defensive:
     - If the file does not exist, returns {}
@@ -71,6 +75,25 @@ def load_terminology_map(path: Path | str | None = None) -> dict[str, list[str]]
     return {str(k): [str(s) for s in v] if isinstance(v, list) else [] for k, v in data.items()}
 
 
+@lru_cache(maxsize=TERMINOLOGY_CACHE_SIZE)
+def load_terminology_map(path: Path | str | None = None) -> dict[str, list[str]]:
+    """
+    Load a canonical->synonyms terminology map from JSON (see `_read_terminology_map`).
+
+    The result is cached per path for the life of the process, so callers must treat it as
+    read-only. Use `load_terminology_map.cache_clear()` to pick up edits without a restart.
+    Text normalization does not need this dict: `normalize_text` uses the precompiled
+    `load_terminology_matcher` instead.
+
+    Args:
+        path: Optional path override. If None, DEFAULT_TERMINOLOGY_PATH is used.
+
+    Returns:
+        dict[str, list[str]]: Canonical term -> list of synonym strings.
+    """
+    return _read_terminology_map(path)
+
+
 def _extract_quoted_placeholders(text: str) -> tuple[str, list[str]]:
     """
     Replace quoted substrings with placeholders, returning:
@@ -125,6 +148,63 @@ def _restore_quoted(text: str, quoted: list[str]) -> str:
     return text
 
 
+@lru_cache(maxsize=TERMINOLOGY_CACHE_SIZE)
+def _compile_terminology(
+    entries: tuple[tuple[str, tuple[str, ...]], ...],
+) -> tuple[re.Pattern | None, dict[str, str]]:
+    """
+    Compile a terminology map into one case-insensitive synonym alternation.
+
+    Synonyms are listed longest-first so that, at any position, the most specific phrase
+    wins. When a synonym appears under several canonical terms, the first one is kept.
+
+    Args:
+        entries: Terminology map flattened to ((canonical, (synonym, ...)), ...) so it is hashable.
+
+    Returns:
+        tuple[re.Pattern | None, dict[str, str]]: (compiled pattern or None if there are no
+        synonyms, lowercased synonym -> canonical term).
+    """
+    canonical_by_synonym: dict[str, str] = {}
+    for canonical, synonyms in entries:
+        for syn in synonyms:
+            if syn.strip():
+                canonical_by_synonym.setdefault(syn.strip().lower(), canonical)
+
+    if not canonical_by_synonym:
+        return None, canonical_by_synonym
+
+    # Word-boundary style protection:
+    # - (?<!\w) ensures the synonym is not preceded by a word character
+    # - (?!\w) ensures the synonym is not followed by a word character
+    # This approximates "whole phrase" matching even for multi-word synonyms.
+    alternation = "|".join(re.escape(syn) for syn in sorted(canonical_by_synonym, key=len, reverse=True))
+    return re.compile(r"(?<!\w)(?:" + alternation + r")(?!\w)", re.IGNORECASE), canonical_by_synonym
+
+
+@lru_cache(maxsize=TERMINOLOGY_CACHE_SIZE)
+def load_terminology_matcher(path: Path | str | None = None) -> tuple[re.Pattern | None, dict[str, str]]:
+    """
+    Load the terminology map at `path` and compile it once per process.
+
+    This is what `normalize_text` uses when no map is passed: the compiled alternation is
+    cached by path, so each call is a cache lookup. It is built from its own read of the
+    file (not from the dict shared by `load_terminology_map`), so nothing a caller does to
+    that dict can leave it stale. Use `load_terminology_matcher.cache_clear()` to pick up
+    edits to the file without a restart.
+
+    Args:
+        path: Optional path override. If None, DEFAULT_TERMINOLOGY_PATH is used.
+
+    Returns:
+        tuple[re.Pattern | None, dict[str, str]]: See `_compile_terminology`.
+    """
+    terminology_map = _read_terminology_map(path)
+    return _compile_terminology(
+        tuple((canonical, tuple(synonyms)) for canonical, synonyms in terminology_map.items())
+    )
+
+
 def normalize_text(text: str, terminology_map: dict[str, list[str]] | None = None) -> str:
     """
     Replace synonym phrases with canonical terms.
@@ -136,10 +216,14 @@ def normalize_text(text: str, terminology_map: dict[str, list[str]] | None = Non
     - Quoted text is left unchanged (both 'single' and "double" quotes).
     - Synonym replacement order is longest-first to prevent shorter phrases
       from pre-empting longer, more specific matches.
+    - Replacement is a single pass, so canonical terms inserted by a replacement
+      are never rewritten again.
 
     Args:
         text: Input string to normalize.
-        terminology_map: Optional canonical->synonyms map. If None, it is loaded from disk.
+        terminology_map: Optional canonical->synonyms map. If None, the default map's
+            precompiled matcher is used (`load_terminology_matcher`); an explicit map is
+            compiled from its current contents (memoized by content).
 
     Returns:
         str: Normalized text.
@@ -148,35 +232,24 @@ def normalize_text(text: str, terminology_map: dict[str, list[str]] | None = Non
     if not text.strip():
         return text
 
-    # Load default terminology map if one wasn't supplied.
+    # One precompiled alternation over every synonym: the default map's is cached per path;
+    # an explicit map is keyed by its current contents, so it can never be stale.
     if terminology_map is None:
-        terminology_map = load_terminology_map()
+        pattern, canonical_by_synonym = load_terminology_matcher()
+    else:
+        pattern, canonical_by_synonym = _compile_terminology(
+            tuple((canonical, tuple(synonyms)) for canonical, synonyms in terminology_map.items())
+        )
 
     # If no mappings exist, return input unchanged.
-    if not terminology_map:
+    if pattern is None:
         return text
 
     # Temporarily replace quoted substrings with placeholders to avoid rewriting them.
     work, quoted = _extract_quoted_placeholders(text)
 
-    # Build (synonym -> canonical) replacement pairs.
-    pairs: list[tuple[str, str]] = []
-    for canonical, synonyms in terminology_map.items():
-        for syn in synonyms:
-            if syn.strip():
-                pairs.append((syn.strip(), canonical))
-
-    # Replace longer synonyms first to reduce conflicts/overlaps.
-    pairs.sort(key=lambda x: -len(x[0]))
-
-    # Apply phrase-level replacements.
-    for synonym, canonical in pairs:
-        # Word-boundary style protection:
-        # - (?<!\w) ensures the synonym is not preceded by a word character
-        # - (?!\w) ensures the synonym is not followed by a word character
-        # This approximates "whole phrase" matching even for multi-word synonyms.
-        pattern = r"(?<!\w)" + re.escape(synonym) + r"(?!\w)"
-        work = re.sub(pattern, canonical, work, flags=re.IGNORECASE)
+    # Replace every synonym in a single pass.
+    work = pattern.sub(lambda m: canonical_by_synonym.get(m.group(0).lower(), m.group(0)), work)
 
     # Restore quoted substrings exactly as originally captured.
     return _restore_quoted(work, quoted)
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from backend.ingestion import chunk_pages
+from backend.ingestion import OVERLAP_TOKENS, chunk_pages
 from backend.schemas import Chunk, ExtractedPage
 from backend.storage import load_chunks, save_chunks
 
@@ -40,6 +40,19 @@ def test_empty_page_produces_one_chunk() -> None:
     assert chunks[0].chunk_text == ""
 
 
+def test_long_page_chunks_overlap() -> None:
+    """Consecutive chunks on a page share a trailing sentence window of >= OVERLAP_TOKENS."""
+    # 40 distinct ~100-token sentences -> several chunks on one page, one sentence of overlap.
+    sentences = [f"Sentence {i:02d} " + "x" * 390 + "." for i in range(40)]
+    chunks = chunk_pages([ExtractedPage(page_number=1, text=" ".join(sentences))], doc_id="doc")
+    assert len(chunks) > 1
+    for prev, nxt in zip(chunks, chunks[1:]):
+        last_of_prev = prev.chunk_text.split(" ")[-3:]
+        first_of_next = nxt.chunk_text.split(" ")[:3]
+        assert last_of_prev == first_of_next
+        assert len(" ".join(first_of_next)) // 4 >= OVERLAP_TOKENS
+
+
 def test_save_and_load_chunks_jsonl(tmp_path: Path) -> None:
     """Chunks save to chunks.jsonl and load back correctly."""
     from backend.storage import generate_document_id
@@ -52,3 +65,23 @@ def test_save_and_load_chunks_jsonl(tmp_path: Path) -> None:
     save_chunks(chunks, doc_id, base_path=tmp_path)
     loaded = load_chunks(doc_id, base_path=tmp_path)
     assert loaded == chunks
+
+
+def test_load_chunks_rereads_file_changed_by_another_writer(tmp_path: Path) -> None:
+    """A cached chunk list is dropped once chunks.jsonl's mtime changes."""
+    import os
+
+    from backend.storage import generate_document_id
+
+    doc_id = generate_document_id()
+    first = [Chunk(chunk_id="c_1_0", page_number=1, doc_id=doc_id, chunk_text="Old.")]
+    path = save_chunks(first, doc_id, base_path=tmp_path)
+    assert load_chunks(doc_id, base_path=tmp_path) == first
+
+    # Rewrite the file without going through save_chunks (as another worker process would).
+    second = Chunk(chunk_id="c_1_0", page_number=1, doc_id=doc_id, chunk_text="New.")
+    path.write_text(second.model_dump_json() + "\n", encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert load_chunks(doc_id, base_path=tmp_path) == [second]
@@ -0,0 +1,17 @@
+"""Tests for cached configuration helpers."""
+
+import pytest
+
+from backend.config import get_openai_client, get_settings
+
+
+def test_openai_client_is_shared(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeated calls return the same client instance (one connection pool)."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    get_settings.cache_clear()
+    get_openai_client.cache_clear()
+    try:
+        assert get_openai_client() is get_openai_client()
+    finally:
+        get_settings.cache_clear()
+        get_openai_client.cache_clear()
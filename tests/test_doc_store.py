@@ -8,12 +8,16 @@ import pytest
 from backend.schemas import ExtractedPage
 from backend.storage import (
     generate_document_id,
+    get_cached_faqs,
     load_chunks,
     load_extracted_pages,
     save_chunks,
     save_extracted_pages,
     save_raw_pdf,
+    save_raw_pdf_stream,
+    set_cached_faqs,
 )
+from backend.utils import cache_invalidate
 
 
 def test_generate_document_id() -> None:
@@ -28,11 +32,12 @@ def test_save_and_load_extracted_pages(tmp_path: Path) -> None:
     doc_id = generate_document_id()
     pages = [
         ExtractedPage(page_number=1, text="Page one"),
-        ExtractedPage(page_number=2, text="Page two"),
+        ExtractedPage(page_number=2, text="Página dos – coinsurance 20%"),
     ]
     saved = save_extracted_pages(pages, doc_id, base_path=tmp_path)
     assert saved.exists()
     assert saved.name == "pages.json"
+    assert json.loads(saved.read_text(encoding="utf-8"))[1]["text"] == pages[1].text
     loaded = load_extracted_pages(doc_id, base_path=tmp_path)
     assert loaded == pages
 
@@ -46,6 +51,15 @@ def test_save_raw_pdf(tmp_path: Path) -> None:
     assert path.name == "raw.pdf"
 
 
+def test_save_raw_pdf_stream(tmp_path: Path) -> None:
+    import io
+    doc_id = generate_document_id()
+    content = b"%PDF-1.4 " + b"x" * (3 << 20)
+    path = save_raw_pdf_stream(io.BytesIO(content), doc_id, base_path=tmp_path)
+    assert path.name == "raw.pdf"
+    assert path.read_bytes() == content
+
+
 def test_load_extracted_pages_missing_raises(tmp_path: Path) -> None:
     doc_id = generate_document_id()
     (tmp_path / doc_id).mkdir(parents=True)
@@ -63,3 +77,13 @@ def test_load_chunks_missing_raises(tmp_path: Path) -> None:
 def test_invalid_document_id_rejected() -> None:
     with pytest.raises(ValueError, match="Invalid document_id"):
         save_raw_pdf(b"x", "bad/id", base_path=Path("/tmp"))
+
+
+def test_cached_faqs_keyed_on_summary_hash(tmp_path: Path) -> None:
+    doc_id = generate_document_id()
+    faqs = {"faqs": [{"question": "What is my deductible?", "answer": "$500"}]}
+    assert get_cached_faqs(doc_id, "h1", base_path=tmp_path) is None
+    set_cached_faqs(doc_id, faqs, "h1", base_path=tmp_path)
+    cache_invalidate(f"faqs:{doc_id}")  # force the on-disk path
+    assert get_cached_faqs(doc_id, "h1", base_path=tmp_path) == faqs
+    assert get_cached_faqs(doc_id, "h2", base_path=tmp_path) is None
@@ -0,0 +1,66 @@
+"""Tests for the lexical helpers behind the evaluation metrics."""
+
+from pathlib import Path
+
+from backend.evaluation import (
+    SENTENCE_BODY_PATTERN,
+    _chunk_supports_bullet,
+    _count_sentences,
+    _extract_context_keywords,
+    _extract_numbers,
+    _normalize_tokens,
+    run_all_evaluations,
+)
+from backend.schemas import Chunk
+
+
+def _chunk(text: str) -> Chunk:
+    return Chunk(chunk_id="c_1_0", page_number=1, doc_id="doc", chunk_text=text)
+
+
+def test_normalize_tokens_lowercases_and_splits() -> None:
+    assert _normalize_tokens("Specialist Visit: $40 copay!") == {"specialist", "visit", "40", "copay"}
+    assert _normalize_tokens("") == set()
+
+
+def test_tokenization_is_memoized_and_immutable() -> None:
+    text = "Deductible is $500 per year."
+    assert _normalize_tokens(text) is _normalize_tokens(text)
+    assert isinstance(_normalize_tokens(text), frozenset)
+    assert _extract_numbers(text) == {"500"}
+    assert _extract_context_keywords(text) == {"deductible", "year"}
+
+
+def test_count_sentences() -> None:
+    assert _count_sentences("") == 0
+    assert _count_sentences("   ") == 0
+    assert _count_sentences("One. Two! Three?") == 3
+    assert _count_sentences("Wait... what?! Trailing fragment") == 3
+    assert _count_sentences(" . ! ") == 0
+
+
+def test_count_sentences_skips_empty_fragments_and_counts_trailing_text() -> None:
+    """Bodies between punctuation runs are counted; whitespace-only fragments are not."""
+    # Empty or whitespace-only fragments between terminal punctuation are not sentences.
+    assert SENTENCE_BODY_PATTERN.findall("One.. . Two") == ["One", " Two"]
+    assert _count_sentences("One.. . Two") == 2
+    assert _count_sentences("\n\t.\u00a0!?\n") == 0
+    # Trailing text without terminal punctuation still counts as a sentence.
+    assert _count_sentences("Deductible applies. Copay is $40") == 2
+    assert _count_sentences("No punctuation at all") == 1
+
+
+def test_chunk_supports_bullet_by_number_in_context() -> None:
+    chunk = _chunk("Emergency room: you pay 250 dollars per visit after deductible.")
+    assert _chunk_supports_bullet("ER visit costs $250", chunk)
+    assert not _chunk_supports_bullet("Dental cleaning costs $75", chunk)
+
+
+def test_run_all_evaluations_without_artifacts(tmp_path: Path) -> None:
+    """Missing summary/chunks/pages yield zero scores instead of raising."""
+    report = run_all_evaluations("no-such-doc", base_path=tmp_path)
+    assert report["doc_id"] == "no-such-doc"
+    assert report["faithfulness"] == 0.0
+    assert report["completeness"] == 0.0
+    assert report["simplicity_score"] == 0.0
+    assert report["summary_flesch"] is None
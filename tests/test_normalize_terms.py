@@ -48,3 +48,32 @@ def test_normalize_text_custom_map() -> None:
     """Custom terminology_map is used when provided."""
     m = {"canonical": ["synonym"]}
     assert normalize_text("Use synonym here.", m) == "Use canonical here."
+
+
+def test_normalize_text_does_not_rewrite_replacements() -> None:
+    """A canonical term produced by one replacement is not rewritten by another synonym."""
+    m = {"in-network": ["network", "participating"], "out-of-network": ["non-participating"]}
+    assert normalize_text("Non-participating and participating providers.", m) == (
+        "out-of-network and in-network providers."
+    )
+
+
+def test_normalize_text_sees_in_place_map_edits() -> None:
+    """Editing an explicit map in place takes effect on the next call (no stale pattern)."""
+    m = {"canonical": ["synonym"]}
+    assert normalize_text("Use synonym here.", m) == "Use canonical here."
+    m["canonical"].append("alias")
+    assert normalize_text("Use alias here.", m) == "Use canonical here."
+
+
+def test_default_matcher_compiled_once() -> None:
+    """Without an explicit map, the default terminology is compiled once and reused."""
+    from unittest.mock import patch
+
+    from backend import utils
+
+    utils.load_terminology_matcher.cache_clear()
+    with patch("backend.utils._read_terminology_map", wraps=utils._read_terminology_map) as read_map:
+        assert "out-of-pocket maximum" in normalize_text("Your OOP max is $5000.")
+        assert "out-of-pocket maximum" in normalize_text("The OOP max resets yearly.")
+    assert read_map.call_count == 1
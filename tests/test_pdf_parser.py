@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from backend.ingestion import extract_pages
+from backend.ingestion import POLICY_KEYWORDS, POLICY_KEYWORD_THRESHOLD, _looks_like_page_number, extract_pages, is_likely_policy
 
 
 def test_extract_pages_file_not_found() -> None:
@@ -37,3 +37,40 @@ def test_extract_pages_empty_pdf() -> None:
         assert pages == []
     finally:
         path.unlink(missing_ok=True)
+
+
+def test_extract_pages_preserves_page_order(tmp_path: Path) -> None:
+    """Each page's text lands on its own 1-indexed ExtractedPage, in document order."""
+    import fitz
+
+    path = tmp_path / "multi.pdf"
+    doc = fitz.open()
+    for i in range(5):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page body {i + 1}: the deductible is ${(i + 1) * 100}.")
+    doc.save(path)
+    doc.close()
+
+    pages = extract_pages(path)
+
+    assert [p.page_number for p in pages] == [1, 2, 3, 4, 5]
+    assert "$300" in pages[2].text
+
+
+@pytest.mark.parametrize("line", ["1", "  12 ", "Page 3 of 10", "page 3  OF 10", "5/12", "5 / 12", ""])
+def test_looks_like_page_number_true(line: str) -> None:
+    assert _looks_like_page_number(line)
+
+
+@pytest.mark.parametrize("line", ["Deductible", "12a", "Page 3", "1.", "$500 / year"])
+def test_looks_like_page_number_false(line: str) -> None:
+    assert not _looks_like_page_number(line)
+
+
+def test_is_likely_policy_threshold() -> None:
+    """Exactly POLICY_KEYWORD_THRESHOLD distinct keywords pass; one fewer fails."""
+    enough = " ".join(POLICY_KEYWORDS[:POLICY_KEYWORD_THRESHOLD])
+    too_few = " ".join(POLICY_KEYWORDS[: POLICY_KEYWORD_THRESHOLD - 1])
+    assert is_likely_policy(enough.upper())
+    assert not is_likely_policy(too_few)
+    assert not is_likely_policy("Invoice #123: consulting services rendered in March.")
@@ -0,0 +1,78 @@
+"""Tests for the exact-match and semantic Q&A response caches."""
+
+from unittest.mock import patch
+
+import pytest
+
+from backend.qa_cache import QueryCache, SemanticQueryCache, make_cache_key
+
+
+def test_make_cache_key_normalizes_case_and_whitespace() -> None:
+    assert make_cache_key("d1", "What is my deductible?") == make_cache_key("d1", "  what is   MY deductible? ")
+    assert make_cache_key("d1", "q") != make_cache_key("d2", "q")
+
+
+def test_query_cache_hit_and_miss() -> None:
+    cache = QueryCache(max_size=4, ttl=60)
+    assert cache.get("d1", "q") is None
+    cache.put("d1", "q", "answer")
+    assert cache.get("d1", "Q ") == "answer"
+    assert cache.get("d2", "q") is None
+
+
+def test_query_cache_evicts_least_recently_used() -> None:
+    cache = QueryCache(max_size=2, ttl=60)
+    cache.put("d", "a", 1)
+    cache.put("d", "b", 2)
+    cache.get("d", "a")  # "a" is now most recently used
+    cache.put("d", "c", 3)
+    assert len(cache) == 2
+    assert cache.get("d", "b") is None
+    assert cache.get("d", "a") == 1
+
+
+def test_query_cache_ttl_expiry() -> None:
+    cache = QueryCache(max_size=4, ttl=10)
+    with patch("backend.qa_cache.time.time", return_value=1000.0):
+        cache.put("d", "q", "v")
+    with patch("backend.qa_cache.time.time", return_value=1011.0):
+        assert cache.get("d", "q") is None
+    assert len(cache) == 0
+
+
+def test_query_cache_invalidate_doc() -> None:
+    cache = QueryCache()
+    cache.put("d1", "q", 1)
+    cache.put("d2", "q", 2)
+    cache.invalidate_doc("d1")
+    assert cache.get("d1", "q") is None
+    assert cache.get("d2", "q") == 2
+
+
+def test_semantic_cache_hits_similar_embedding_only() -> None:
+    cache = SemanticQueryCache(threshold=0.9, ttl=60)
+    cache.put("d1", [1.0, 0.0, 0.0], "deductible answer")
+    assert cache.get("d1", [2.0, 0.1, 0.0]) == "deductible answer"  # scale-invariant, cos ~ 0.999
+    assert cache.get("d1", [0.0, 1.0, 0.0]) is None
+    assert cache.get("d2", [1.0, 0.0, 0.0]) is None
+
+
+def test_semantic_cache_returns_best_match_and_bounds_size() -> None:
+    cache = SemanticQueryCache(threshold=0.5, max_per_doc=2, ttl=60)
+    cache.put("d", [1.0, 0.0], "a")
+    cache.put("d", [0.7, 0.7], "b")
+    assert cache.get("d", [0.6, 0.8]) == "b"
+    cache.put("d", [0.0, 1.0], "c")
+    assert len(cache) == 2
+    assert cache.get("d", [1.0, 0.0], threshold=0.99) is None  # oldest entry "a" evicted
+
+
+def test_semantic_cache_ttl_and_invalidate() -> None:
+    cache = SemanticQueryCache(ttl=10)
+    with patch("backend.qa_cache.time.time", return_value=1000.0):
+        cache.put("d1", [1.0, 0.0], "v")
+        cache.put("d2", [1.0, 0.0], "w")
+    with patch("backend.qa_cache.time.time", return_value=1011.0):
+        assert cache.get("d1", [1.0, 0.0]) is None
+    cache.invalidate_doc("d2")
+    assert len(cache) == 0
@@ -0,0 +1,65 @@
+"""Tests for LLM JSON output parsing in the Q&A and summarization modules."""
+
+import pytest
+
+from backend.qa import _parse_llm_json, _qa_build_context, _validate_citations
+from backend.summarization import _parse_llm_json as _parse_summary_json
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ('{"answer": "x"}', {"answer": "x"}),
+        ('```json\n{"answer": "x"}\n```', {"answer": "x"}),
+        ('```\n{"a": {"b": 2}}```', {"a": {"b": 2}}),
+        ('Here you go: {"a": 1} and some {trailing} prose', {"a": 1}),
+        ("no json here", {}),
+        ('{"a": truncated', {}),
+    ],
+)
+def test_parse_llm_json(raw: str, expected: dict) -> None:
+    assert _parse_llm_json(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ('{"present": true}', {"present": True}),
+        ('```json\n{"present": true}\n```', {"present": True}),
+        ('Note: {"present": true, "note": "see {page 3}"} done}', {"present": True, "note": "see {page 3}"}),
+        ("[1, 2]", None),
+        ("no json here", None),
+    ],
+)
+def test_parse_summary_json(raw: str, expected: dict | None) -> None:
+    assert _parse_summary_json(raw) == expected
+
+
+def test_validate_citations_filters_to_retrieved_chunks() -> None:
+    raw = [
+        {"chunk_id": "c_1_0", "page": "2"},
+        {"chunk_id": "c_9_9", "page": 3},  # not retrieved
+        {"chunk_id": "c_1_1", "page": None},
+        {"chunk_id": "c_1_1", "page": 0},
+        "c_1_0",
+    ]
+    out = _validate_citations(raw, {"c_1_0", "c_1_1"})
+    assert [(c.chunk_id, c.page) for c in out] == [("c_1_0", 2)]
+
+
+def test_qa_build_context_format() -> None:
+    chunks = [
+        {"chunk_id": "c_1_0", "page_number": 1, "chunk_text": "  Deductible is $500. "},
+        {"chunk_id": "c_2_0", "page_number": 2, "chunk_text": None},
+    ]
+    assert _qa_build_context(chunks) == (
+        "---\nChunk c_1_0 (page 1):\nDeductible is $500.\n\n---\nChunk c_2_0 (page 2):"
+    )
+    assert _qa_build_context([]) == ""
+
+
+def test_qa_build_context_token_budget() -> None:
+    chunks = [{"chunk_id": f"c_{i}_0", "page_number": i, "chunk_text": "x" * 400} for i in range(1, 5)]  # ~100 tokens each
+    assert _qa_build_context(chunks, max_tokens=250).count("---") == 2
+    assert _qa_build_context(chunks, max_tokens=10).count("---") == 1  # first chunk always kept
+    assert _qa_build_context(chunks, max_tokens=None).count("---") == 4
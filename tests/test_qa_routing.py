@@ -0,0 +1,134 @@
+"""Tests for Q&A question routing (no retrieval or LLM calls)."""
+
+import pytest
+
+from backend import qa
+from backend.config import get_settings
+
+
+@pytest.fixture
+def routed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace route handlers with stubs that report which route was taken."""
+    monkeypatch.setattr(qa, "handle_greeting", lambda doc_id, q: ("greeting", None))
+    monkeypatch.setattr(qa, "ask_scenario", lambda doc_id, q, scenario_type="General": ("scenario", scenario_type))
+    monkeypatch.setattr(qa, "_handle_section_detail", lambda doc_id, q, section: ("section", section))
+    monkeypatch.setattr(qa, "ask", lambda doc_id, q: ("ask", None))
+
+
+def test_route_greeting(routed: None) -> None:
+    """Greetings are handled without retrieval."""
+    assert qa.route_question("doc", "Hello there")[0] == "greeting"
+    assert qa.route_question("doc", "  Who are you?")[0] == "greeting"
+    # Greeting prefixes inside a longer word are not greetings.
+    assert qa.route_question("doc", "High deductible plans: what applies?")[0] == "ask"
+
+
+def test_greeting_prefilter_covers_every_greeting_phrase() -> None:
+    """Every greeting phrase passes both the startswith prefilter and the regex."""
+    for phrase in qa._GREETING_PREFIXES:
+        assert phrase.startswith(qa._GREETING_PREFIXES)
+        assert qa.GREETING_RE.match(phrase), phrase
+    assert len(qa.GREETING_PATTERNS) == 1 + len(qa._GREETING_QUESTIONS)
+
+
+def test_route_section_deep_dive(routed: None) -> None:
+    """Detail intent plus a section name routes to that section."""
+    assert qa.route_question("doc", "Give me more detail about Cost Summary") == ("section", "Cost Summary")
+    assert qa.route_question("doc", "Deep dive into exclusions & limitations") == (
+        "section",
+        "Exclusions & Limitations",
+    )
+
+
+def test_route_detail_without_section_falls_back(routed: None) -> None:
+    """Detail intent without a known section name falls back to standard Q&A."""
+    assert qa.route_question("doc", "Explain copays in more detail")[0] == "ask"
+
+
+def test_route_priority_is_preserved(routed: None) -> None:
+    """Scenario triggers win over detail intent, and greetings only match at the start."""
+    q = "In more detail about Cost Summary: what would happen if I break my arm?"
+    assert qa.route_question("doc", q) == ("scenario", "General")
+    assert qa.route_question("doc", "Can you say hi to my agent?")[0] == "ask"
+
+
+def test_ask_skips_llm_when_retrieval_is_weak(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A top chunk beyond max_retrieval_distance returns not_found without calling the LLM."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("MAX_RETRIEVAL_DISTANCE", "1.0")
+    get_settings.cache_clear()
+    monkeypatch.setattr(qa, "_embed_question", lambda q: None)
+    monkeypatch.setattr(qa, "get_openai_client", lambda: pytest.fail("LLM should not be called"))
+    monkeypatch.setattr(
+        qa.storage,
+        "query",
+        lambda *a, **k: [{"chunk_id": "c_1_0", "page_number": 1, "chunk_text": "x", "distance": 1.4}],
+    )
+    try:
+        out = qa.ask("doc", "What is the dental waiting period?")
+    finally:
+        get_settings.cache_clear()
+    assert out.answer_type == "not_found"
+    assert out.answer == qa.NOT_FOUND_ANSWER
+
+
+def test_ask_confidence_and_citations_use_only_budgeted_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Chunks dropped by the context token budget neither count toward confidence nor can be cited."""
+    from unittest.mock import MagicMock
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    get_settings.cache_clear()
+    monkeypatch.setattr(qa, "_embed_question", lambda q: None)
+    big = "x" * (qa.QA_CONTEXT_MAX_TOKENS * 4)  # fills the whole budget on its own
+    monkeypatch.setattr(
+        qa.storage,
+        "query",
+        lambda *a, **k: [
+            {"chunk_id": f"c_1_{i}", "page_number": 1, "chunk_text": big, "distance": 0.1} for i in range(3)
+        ],
+    )
+    client = MagicMock()
+    client.chat.completions.create.return_value.choices[0].message.content = (
+        '{"answer": "Yes.", "answer_type": "answerable", '
+        '"citations": [{"chunk_id": "c_1_0", "page": 1}, {"chunk_id": "c_1_2", "page": 1}]}'
+    )
+    monkeypatch.setattr(qa, "get_openai_client", lambda: client)
+    try:
+        out = qa.ask("doc", "Is the deductible waived for preventive care?")
+    finally:
+        get_settings.cache_clear()
+
+    assert [c.chunk_id for c in out.citations] == ["c_1_0"]
+    assert out.confidence == "medium"
+
+
+def test_ask_scenario_caches_without_embedding_the_question(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Scenario answers are cached per (scenario type, question) with no question embedding."""
+    from unittest.mock import MagicMock
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    get_settings.cache_clear()
+    qa.scenario_cache.clear()
+    monkeypatch.setattr(qa.storage, "embed_query", lambda q: pytest.fail("question should not be embedded"))
+    monkeypatch.setattr(qa.storage, "embed_static_query", lambda q: (0.1, 0.2))
+    monkeypatch.setattr(
+        qa.storage,
+        "query",
+        lambda *a, **k: [{"chunk_id": "c_1_0", "page_number": 1, "chunk_text": "ER copay $250.", "distance": 0.1}],
+    )
+    client = MagicMock()
+    client.chat.completions.create.return_value.choices[0].message.content = (
+        '{"steps": [{"step_number": 1, "text": "You pay $250.", "citations": [{"chunk_id": "c_1_0", "page": 1}]}]}'
+    )
+    monkeypatch.setattr(qa, "get_openai_client", lambda: client)
+    try:
+        first = qa.ask_scenario("doc", "What if I go to the ER?", scenario_type="ER")
+        again = qa.ask_scenario("doc", "what if I go to the  ER?", scenario_type="ER")
+        qa.ask_scenario("doc", "What if I go to the ER?", scenario_type="General")
+    finally:
+        get_settings.cache_clear()
+        qa.scenario_cache.clear()
+
+    assert again.steps == first.steps
+    assert again.question == "what if I go to the  ER?"
+    assert client.chat.completions.create.call_count == 2  # different scenario type misses
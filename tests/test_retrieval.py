@@ -4,7 +4,7 @@ from unittest.mock import patch
 
 import pytest
 
-from backend.retrieval import CORE_SECTIONS, retrieve_for_section, SECTION_QUERIES
+from backend.retrieval import CORE_SECTIONS, retrieve_all_sections, retrieve_for_section, SECTION_QUERIES
 
 
 def test_section_queries_cover_core_sections() -> None:
@@ -24,7 +24,7 @@ def test_retrieve_for_section_returns_chunks_with_metadata() -> None:
         {"chunk_id": "c_2_0", "page_number": 2, "doc_id": "doc1", "chunk_text": "Deductible is $500.", "distance": 0.1},
         {"chunk_id": "c_1_0", "page_number": 1, "doc_id": "doc1", "chunk_text": "Copay $25.", "distance": 0.2},
     ]
-    with patch("backend.storage.query", return_value=fake_hits):
+    with patch("backend.storage.query_many", side_effect=lambda doc_id, qs, top_k, **_: [fake_hits for _ in qs]):
         results = retrieve_for_section("doc1", "Cost Summary", top_k_per_query=5, max_chunks=10)
     assert len(results) >= 1
     for r in results:
@@ -40,8 +40,46 @@ def test_retrieve_for_section_returns_chunks_with_metadata() -> None:
 def test_retrieve_for_section_dedupes_and_caps() -> None:
     """Same chunk from two queries appears once; total count capped by max_chunks."""
     hit = {"chunk_id": "c_1_0", "page_number": 1, "doc_id": "d", "chunk_text": "Same.", "distance": 0.0}
-    with patch("backend.storage.query", return_value=[hit]):
+    with patch("backend.storage.query_many", side_effect=lambda doc_id, qs, top_k, **_: [[hit] for _ in qs]) as mock_query:
         results = retrieve_for_section("d", "Plan Snapshot", top_k_per_query=2, max_chunks=5)
     # Same chunk returned for each of the 3 Plan Snapshot queries, but deduped to one
     assert len(results) == 1
     assert results[0]["chunk_id"] == "c_1_0"
+    # All sub-queries go to the vector store in a single batched call
+    assert mock_query.call_count == 1
+
+
+def test_retrieve_for_section_keeps_closest_hit() -> None:
+    """When sub-queries return the same chunk, the smallest distance wins."""
+    far = {"chunk_id": "c_1_0", "page_number": 1, "doc_id": "d", "chunk_text": "A", "distance": 0.9}
+    near = dict(far, distance=0.1)
+    with (
+        patch("backend.storage.embed_static_queries", side_effect=lambda qs: tuple((1.0,) for _ in qs)),
+        patch("backend.storage.query_many", return_value=[[far], [near], []]) as mock_query,
+    ):
+        results = retrieve_for_section("d", "Plan Snapshot")
+    assert [r["distance"] for r in results] == [0.1]
+    # Cached sub-query embeddings are forwarded so Chroma does not re-embed the constants
+    assert mock_query.call_args.kwargs["query_embeddings"] == ((1.0,), (1.0,), (1.0,))
+
+
+def test_retrieve_all_sections_matches_per_section_retrieval() -> None:
+    """One batched query over every sub-query yields the same per-section results."""
+
+    def fake_query_many(doc_id, qs, top_k, **_):
+        # Deterministic hits derived from the query text so sections get different chunks.
+        return [
+            [{"chunk_id": f"c_{len(q)}_0", "page_number": len(q), "doc_id": doc_id, "chunk_text": q, "distance": 0.5}]
+            for q in qs
+        ]
+
+    with (
+        patch("backend.storage.embed_static_queries", side_effect=Exception("offline")),
+        patch("backend.storage.query_many", side_effect=fake_query_many) as mock_query,
+    ):
+        batched = retrieve_all_sections("d")
+        assert mock_query.call_count == 1
+        per_section = {s: retrieve_for_section("d", s) for s in CORE_SECTIONS}
+
+    assert list(batched) == list(CORE_SECTIONS)
+    assert batched == per_section
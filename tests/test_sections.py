@@ -2,7 +2,7 @@
 
 import pytest
 
-from backend.retrieval import CORE_SECTIONS
+from backend.retrieval import CORE_SECTIONS, CORE_SECTIONS_SET
 
 
 def test_core_sections_defined() -> None:
@@ -10,3 +10,11 @@ def test_core_sections_defined() -> None:
     assert len(CORE_SECTIONS) == 6
     assert "Plan Snapshot" in CORE_SECTIONS
     assert "Exclusions & Limitations" in CORE_SECTIONS
+
+
+def test_core_sections_set_matches_tuple() -> None:
+    """Frozenset view has the same members as the ordered tuple."""
+    assert isinstance(CORE_SECTIONS_SET, frozenset)
+    assert CORE_SECTIONS_SET == set(CORE_SECTIONS)
+    assert "Plan Snapshot" in CORE_SECTIONS_SET
+    assert "Exclusions & Limitations" in CORE_SECTIONS_SET
@@ -1,12 +1,13 @@
 """Tests for vector store (Chroma). Uses fake embedding to avoid API key."""
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+from chromadb.errors import NotFoundError
 
 from backend.schemas import Chunk
-from backend.storage import add_chunks, query
+from backend.storage import _get_collection, add_chunks, query, query_many, warm_up, wipe_database
 
 # text-embedding-3-small dimension
 EMBEDDING_DIM = 1536
@@ -35,6 +36,25 @@ def test_add_chunks_empty_list_no_op() -> None:
         add_chunks("doc1", [])
 
 
+def test_add_chunks_writes_in_batches() -> None:
+    """Large documents are added to Chroma in CHROMA_ADD_BATCH_SIZE slices, in order."""
+    chunks = [
+        Chunk(chunk_id=f"c_1_{i}", page_number=1, doc_id="doc1", chunk_text=f"Text {i}.")
+        for i in range(5)
+    ]
+    collection = MagicMock()
+    with (
+        patch("backend.storage.CHROMA_ADD_BATCH_SIZE", 2),
+        patch("backend.storage.wipe_database"),
+        patch("backend.storage._get_collection", return_value=collection),
+        patch("backend.storage._embed_texts", side_effect=lambda texts: [[0.0]] * len(texts)),
+    ):
+        add_chunks("doc1", chunks)
+
+    batches = [c.kwargs["ids"] for c in collection.add.call_args_list]
+    assert batches == [["c_1_0", "c_1_1"], ["c_1_2", "c_1_3"], ["c_1_4"]]
+
+
 def test_add_chunks_and_query_structure(
     temp_chroma_path: Path,
 ) -> None:
@@ -65,3 +85,137 @@ def test_add_chunks_and_query_structure(
         assert "doc_id" in r
         assert "chunk_text" in r
         assert r["doc_id"] == "doc1"
+
+
+def test_query_many_single_call_and_blank_slots() -> None:
+    """query_many sends non-blank queries in one Chroma call and maps results back by position."""
+    collection = MagicMock()
+    collection.query.return_value = {
+        "ids": [["c_1_0"], ["c_2_0"]],
+        "documents": [["Deductible $500."], ["Copay $25."]],
+        "metadatas": [[{"page_number": 1, "doc_id": "d"}], [{"page_number": 2, "doc_id": "d"}]],
+        "distances": [[0.1], [0.2]],
+    }
+    with patch("backend.storage._get_collection", return_value=collection), patch("backend.storage._get_client"):
+        results = query_many("d", ["deductible", "  ", "copay"], top_k=1)
+
+    assert collection.query.call_count == 1
+    assert collection.query.call_args.kwargs["query_texts"] == ["deductible", "copay"]
+    assert [[h["chunk_id"] for h in hits] for hits in results] == [["c_1_0"], [], ["c_2_0"]]
+    assert results[2][0]["page_number"] == 2
+
+
+def test_query_results_cached_until_wipe() -> None:
+    """Repeated identical queries hit Chroma once; wiping the store invalidates the cache."""
+    collection = MagicMock()
+    collection.query.return_value = {
+        "ids": [["c_1_0"]],
+        "documents": [["Deductible $500."]],
+        "metadatas": [[{"page_number": 1, "doc_id": "cache-doc"}]],
+        "distances": [[0.1]],
+    }
+    with patch("backend.storage._get_collection", return_value=collection), patch("backend.storage._get_client"):
+        first = query("cache-doc", "deductible", top_k=3)
+        assert query("cache-doc", "deductible", top_k=3) == first
+        assert collection.query.call_count == 1
+
+        wipe_database()
+        query("cache-doc", "deductible", top_k=3)
+        assert collection.query.call_count == 2
+
+
+def test_query_result_cache_keys_are_exact() -> None:
+    """Query lists that differ in how words split across queries, or in case, are not conflated."""
+    collection = MagicMock()
+    collection.query.side_effect = lambda **kw: {
+        "ids": [[f"hit:{q}"] for q in kw["query_texts"]],
+        "documents": [["text"] for _ in kw["query_texts"]],
+        "metadatas": [[{"page_number": 1, "doc_id": "exact-doc"}] for _ in kw["query_texts"]],
+        "distances": [[0.1] for _ in kw["query_texts"]],
+    }
+    with patch("backend.storage._get_collection", return_value=collection):
+        first = query_many("exact-doc", ["a b", "c"], top_k=3)
+        second = query_many("exact-doc", ["a", "b c"], top_k=3)
+        upper = query_many("exact-doc", ["A b", "c"], top_k=3)
+
+    assert [[h["chunk_id"] for h in hits] for hits in first] == [["hit:a b"], ["hit:c"]]
+    assert [[h["chunk_id"] for h in hits] for hits in second] == [["hit:a"], ["hit:b c"]]
+    assert [[h["chunk_id"] for h in hits] for hits in upper] == [["hit:A b"], ["hit:c"]]
+    assert collection.query.call_count == 3
+
+
+def test_collection_handle_cached_until_wipe() -> None:
+    """The collection handle is reused between calls and refreshed after wipe_database."""
+    client = MagicMock()
+    client.get_or_create_collection.side_effect = lambda **_: object()
+    _get_collection.cache_clear()
+    with patch("backend.storage._get_client", return_value=client), patch("backend.storage._get_embedding_function"):
+        first = _get_collection()
+        assert _get_collection() is first
+        wipe_database()
+        assert _get_collection() is not first
+    _get_collection.cache_clear()
+
+
+def test_warm_up_swallows_errors() -> None:
+    """Startup warm-up never raises; a cold cache only costs first-request latency."""
+    with patch("backend.storage._get_collection", side_effect=RuntimeError("chroma unavailable")):
+        warm_up(("deductible",))
+
+
+def test_lifespan_does_not_wait_for_warm_up() -> None:
+    """App startup completes while the (network-bound) warm-up is still running."""
+    import asyncio
+    import threading
+
+    from backend import main
+
+    release = threading.Event()
+
+    async def run() -> None:
+        with patch("backend.main._warm_up", side_effect=lambda: release.wait(5)):
+            async with main.lifespan(main.app):
+                pass  # reached without the warm-up finishing
+        release.set()
+
+    asyncio.run(asyncio.wait_for(run(), timeout=2))
+
+
+def test_query_retries_with_fresh_collection_after_failure() -> None:
+    """A stale collection handle (e.g. wiped by another worker) is dropped and the query retried."""
+    stale, fresh = MagicMock(), MagicMock()
+    stale.query.side_effect = NotFoundError("Collection does not exist")
+    fresh.query.return_value = {
+        "ids": [["c_1_0"]],
+        "documents": [["Deductible is $500."]],
+        "metadatas": [[{"page_number": 1, "doc_id": "retry-doc"}]],
+        "distances": [[0.1]],
+    }
+    with patch("backend.storage._get_collection", side_effect=[stale, fresh]) as get_collection:
+        get_collection.cache_clear = MagicMock()
+        hits = query("retry-doc", "deductible", top_k=1)
+
+    get_collection.cache_clear.assert_called_once()
+    assert [h["chunk_id"] for h in hits] == ["c_1_0"]
+
+
+def test_query_raises_when_retry_fails() -> None:
+    """A collection that is still missing after refreshing the handle raises instead of returning []."""
+    broken = MagicMock()
+    broken.query.side_effect = NotFoundError("Collection does not exist")
+    with patch("backend.storage._get_collection", return_value=broken):
+        with pytest.raises(NotFoundError):
+            query("raise-doc", "deductible", top_k=1)
+    assert broken.query.call_count == 2
+
+
+def test_query_other_errors_raise_without_retry() -> None:
+    """Non-stale failures (auth, rate limits, timeouts) propagate on the first attempt."""
+    broken = MagicMock()
+    broken.query.side_effect = RuntimeError("rate limited")
+    with patch("backend.storage._get_collection", return_value=broken) as get_collection:
+        get_collection.cache_clear = MagicMock()
+        with pytest.raises(RuntimeError, match="rate limited"):
+            query("no-retry-doc", "deductible", top_k=1)
+    assert broken.query.call_count == 1
+    get_collection.cache_clear.assert_not_called()